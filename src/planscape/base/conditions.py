@@ -45,34 +45,37 @@ def weighted_average_condition(
                 "Raster has NaN values, but NaN is not defined as NoData value."
             )
 
-    sum = None
-    total_weight = None
-    for condition, weight in conditions_with_weights:
-        # Convert all conditions to float. This allows us to output NoData values as NaN.
-        condition = condition.astype("float32")
-
-        # Convert all NoData values to NaN
-        condition_is_nodata = (
-            np.isnan(condition)
-            if np.isnan(no_data_value)
-            else (condition == no_data_value)
-        )
-        weighted_path = ~condition_is_nodata * weight
-        condition[condition_is_nodata] = np.nan
-
-        if sum is None or total_weight is None:
-            sum = np.nan_to_num(condition, nan=0) * weight
-            total_weight = weighted_path
-        else:
-            # Set NoData values to 0, then add condition*weight to rolling sum.
-            raw = np.nan_to_num(sum, nan=0) + np.nan_to_num(condition, nan=0) * weight
-            # Masked array is True if both sum and condition arrays have NoData value.
-            raw = np.ma.masked_array(raw, np.isnan(sum) & condition_is_nodata)
-            # Set True value to Nan.
-            sum = np.ma.filled(raw, no_data_value)
-            total_weight = total_weight + weighted_path
-    if sum is None or total_weight is None:
+    if not conditions_with_weights:
         return None
+
+    # Unlike elementwise arithmetic, stacking does not broadcast, so conditions of
+    # different (even broadcastable) shapes are rejected.
+    shapes = {np.shape(condition) for condition, _ in conditions_with_weights}
+    if len(shapes) > 1:
+        raise ValueError("Conditions must all have the same shape.")
+
+    # Stack the conditions into one contiguous (num_conditions, ...) array, so that
+    # NoData masking and the weighted sum are computed in single vectorized passes.
+    # Converting to float allows us to output NoData values as NaN.
+    conditions = np.stack(
+        [condition.astype("float32") for condition, _ in conditions_with_weights]
+    )
+    # Shaped (num_conditions, 1, ...) to broadcast against the stacked conditions.
+    weights = np.array([weight for _, weight in conditions_with_weights]).reshape(
+        (-1,) + (1,) * (conditions.ndim - 1)
+    )
+
+    condition_is_nodata = (
+        np.isnan(conditions)
+        if np.isnan(no_data_value)
+        else (conditions == no_data_value)
+    )
+    # NoData values contribute neither to the sum nor to the total weight.
+    conditions[condition_is_nodata] = 0
+    # As with per-condition passes, the weighted sum accumulates in float32, one
+    # condition after another, while the total weight is kept in float64.
+    sum = np.sum(conditions * weights.astype("float32"), axis=0)
+    total_weight = np.sum(~condition_is_nodata * weights, axis=0)
     with np.errstate(divide="ignore", invalid="ignore"):
         return cast(ConditionMatrix, sum / total_weight)
 
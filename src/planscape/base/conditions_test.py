@@ -130,6 +130,27 @@ class WeightedAverageTest(unittest.TestCase):
         if average is not None:
             self.assertTrue(np.all(np.nan_to_num(average) == np.nan_to_num(expected)))
 
+    def test_weighted_average_accumulates_in_float32(self):
+        # 2**24 + 1 is not representable in float32, so the sum rounds to 2**24.
+        condition1 = np.array([[2**24]])
+        condition2 = np.array([[1]])
+        expected = np.array([[2**23]])
+        average = weighted_average_condition(
+            np.nan, [(condition1, 1.0), (condition2, 1.0)]
+        )
+        self.assertIsNotNone(average)
+        self.assertTrue(np.all(average == expected))
+
+    def test_weighted_average_different_shapes(self):
+        condition1 = np.array([[1, 2, 3], [4, 5, 6]])
+        condition2 = np.array([[11, 12, 13]])
+        self.assertRaises(
+            ValueError,
+            weighted_average_condition,
+            np.nan,
+            [(condition1, 0.5), (condition2, 0.5)],
+        )
+
 
 class ManagementConditionTest(unittest.TestCase):
     def test_current_condition(self):
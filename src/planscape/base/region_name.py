@@ -18,40 +18,31 @@ class RegionName(str, enum.Enum):
     SOUTHERN_CALIFORNIA = "southern-california"
 
 
+# Display names for each region.  Being a str enum, a RegionName hashes and compares
+# like its value, so these also look up plain region name strings from the database.
+_DISPLAY_NAMES: dict[RegionName, str] = {
+    RegionName.TCSI: "TCSI",
+    RegionName.SIERRA_NEVADA: "Sierra Nevada",
+    RegionName.NORTHERN_CALIFORNIA: "Northern California",
+    RegionName.CENTRAL_COAST: "Central Coast",
+    RegionName.SOUTHERN_CALIFORNIA: "Southern California",
+}
+
+_REGIONS_BY_DISPLAY_NAME: dict[str, RegionName] = {
+    display_name: region for region, display_name in _DISPLAY_NAMES.items()
+}
+
+
 def region_to_display_name(region: RegionName) -> str | None:
     """
     Converts a backend RegionName to the display name.
+    Returns None for region names that are now unknown.
     """
-    match region:
-        case RegionName.TCSI:
-            return "TCSI"
-        case RegionName.SIERRA_NEVADA:
-            return "Sierra Nevada"
-        case RegionName.NORTHERN_CALIFORNIA:
-            return "Northern California"
-        case RegionName.CENTRAL_COAST:
-            return "Central Coast"
-        case RegionName.SOUTHERN_CALIFORNIA:
-            return "Southern California"
-        case _:
-            # Necessary for region names that are now unknown.
-            return None
+    return _DISPLAY_NAMES.get(region)
 
 
 def display_name_to_region(region: str) -> RegionName | None:
     """
-    Converts a backend RegionName to the display name.
+    Converts a display name to the backend RegionName.
     """
-    match region:
-        case "TCSI":
-            return RegionName.TCSI
-        case "Sierra Nevada":
-            return RegionName.SIERRA_NEVADA
-        case "Northern California":
-            return RegionName.NORTHERN_CALIFORNIA
-        case "Central Coast":
-            return RegionName.CENTRAL_COAST
-        case "Southern California":
-            return RegionName.SOUTHERN_CALIFORNIA
-        case _:
-            return None
+    return _REGIONS_BY_DISPLAY_NAME.get(region)
@@ -19,6 +19,9 @@ class RegionNameTest(TestCase):
         self.assertEqual(
             region_to_display_name(RegionName.CENTRAL_COAST), "Central Coast"
         )
+        # Region names read back from the database are plain strings.
+        self.assertEqual(region_to_display_name("sierra-nevada"), "Sierra Nevada")
+        self.assertEqual(region_to_display_name("unknown"), None)
 
     def test_display_name_to_region(self):
         self.assertEqual(display_name_to_region("TCSI"), RegionName.TCSI)
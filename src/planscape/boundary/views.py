@@ -1,6 +1,7 @@
 import json
 import logging
 import os
+from functools import lru_cache
 
 
 from config.boundary_config import BoundaryConfig
@@ -25,19 +26,27 @@ boundary_config = BoundaryConfig(
 )
 
 
+@lru_cache(maxsize=1)
+def get_boundaries_by_region_name() -> dict:
+    """
+    Reads the boundary config once and indexes each region's boundaries by
+    region name. Call get_boundaries_by_region_name.cache_clear() to force a
+    re-read.
+    """
+    config_path = os.path.join(settings.BASE_DIR, "config/boundary.json")
+    with open(config_path, "r") as f:
+        boundary_config = json.load(f)
+    return {
+        region["region_name"]: region["boundaries"]
+        for region in boundary_config["regions"]
+    }
+
+
 def get_config(params: QueryDict):
     assert isinstance(params["region_name"], str)
     region_name = params["region_name"]
 
-    # Read from boundary config
-    config_path = os.path.join(settings.BASE_DIR, "config/boundary.json")
-    boundary_config = json.load(open(config_path, "r"))
-
-    for region in boundary_config["regions"]:
-        if region_name == region["region_name"]:
-            return region["boundaries"]
-
-    return None
+    return get_boundaries_by_region_name().get(region_name)
 
 
 def config(request: HttpRequest) -> HttpResponse:
@@ -1,7 +1,7 @@
 import json
 from pathlib import Path
 from django.conf import settings
-from django.core.management.base import BaseCommand, CommandParser
+from django.core.management.base import BaseCommand, CommandError, CommandParser
 from django.db import transaction
 from base.condition_types import ConditionLevel, ConditionScoreType
 from conditions.models import BaseCondition, Condition
@@ -24,68 +24,193 @@ class Command(BaseCommand):
             help="Configures if this is a dry-run. If true, no changes will be persisted.",
         )
 
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Maximum number of rows inserted per query.",
+        )
+
     def handle(self, *args, **options):
         conditions_file = options["conditions_file"]
-        path = Path(conditions_file)
-        if not path.exists():
-            self.stderr.write(f"Conditions file {conditions_file} does not exist")
-            return
-
-        with open(conditions_file) as f:
-            conditions = json.load(f)
-
-            with transaction.atomic():
-                metrics = self.get_metrics(conditions["regions"])
-
-                conditions = list([self.process_metric(metric) for metric in metrics])
-                total = len(conditions)
-                success = len([condition for condition in conditions if condition])
-                failure = total - success
+        try:
+            with Path(conditions_file).open() as f:
+                conditions = json.load(f)
+        except FileNotFoundError:
+            raise CommandError(f"Conditions file {conditions_file} does not exist")
+
+        # Flatten the config before opening the transaction, so that it only
+        # spans the database reads and writes.
+        metrics = self.get_metrics(conditions["regions"])
+
+        # TODO: if we ever start using normalized metrics again we need
+        # to stop using hardcoded level, score type and is_raw, and
+        # read them from the conditions.json file
+        score_type = ConditionScoreType.CURRENT
+        raw = True
 
+        with transaction.atomic():
+            base_conditions, existing = self.get_existing(metrics, score_type, raw)
+            num_existing_base_conditions = len(base_conditions)
+            num_existing_conditions = len(existing)
+            base_conditions = self.load_base_conditions(
+                metrics, base_conditions, options["batch_size"]
+            )
+            conditions = self.load_conditions(
+                metrics,
+                base_conditions,
+                existing,
+                score_type,
+                raw,
+                options["batch_size"],
+            )
+            base_conditions_created = (
+                len(base_conditions) - num_existing_base_conditions
+            )
+            conditions_created = len(existing) - num_existing_conditions
+
+            if options["dry_run"]:
+                transaction.set_rollback(True)
+
+        # Report after the transaction is closed, so that writing to stdout
+        # does not hold it open.
+        if options["verbosity"] >= 2:
+            for metric in metrics:
                 self.stdout.write(
-                    f"Conditions Loaded: {success}.\n" f"Conditions Failed: {failure}"
+                    f"[OK] {metric['region_name']}:{metric['metric_name']}"
                 )
 
-                if options["dry_run"]:
-                    transaction.set_rollback(True)
+        total = len(conditions)
+        success = len([condition for condition in conditions if condition])
+        failure = total - success
 
-    def get_metrics(self, regions):
-        regions = (region for region in regions)
-        pillars = self.flatten_inner(regions, "pillars")
-        elements = self.flatten_inner(pillars, "elements")
-        metrics = self.flatten_inner(elements, "metrics")
-        return metrics
-
-    def flatten_inner(self, parents, key):
-        for parent in parents:
-            children = parent.pop(key)
-            for child in children:
-                yield {**parent, **child}
-
-    def process_metric(self, metric):
-        # if we start to use normalized metrics again
-        # we will need to change this code to stop
-        # using hardcoded level, score type and is_raw
-        base_condition, _created = BaseCondition.objects.update_or_create(
-            condition_name=metric["metric_name"],
-            display_name=metric["display_name"],
-            region_name=metric["region_name"],
-            condition_level=ConditionLevel.METRIC,
+        self.stdout.write(
+            f"Conditions Loaded: {success}.\n"
+            f"Conditions Failed: {failure}.\n"
+            f"Base Conditions Created: {base_conditions_created}.\n"
+            f"Conditions Created: {conditions_created}"
         )
-        # TODO: if we ever start using normalized metrics again we need to change this
-        # to read from the conditions.json file
-        score_type = ConditionScoreType.CURRENT
-        raw = True
 
-        raster_name = metric["raw_data_download_path"]
-
-        condition, _created = Condition.objects.update_or_create(
-            condition_dataset=base_condition,
-            raster_name=raster_name,
-            condition_score_type=score_type,
-            is_raw=raw,
+    def get_metrics(self, regions):
+        """
+        Returns one flat record per metric, tagged with the names of the
+        region, pillar and element that contain it. The input is not mutated.
+        """
+        return [
+            {
+                "region_name": region["region_name"],
+                "pillar_name": pillar["pillar_name"],
+                "element_name": element["element_name"],
+                **metric,
+            }
+            for region in regions
+            for pillar in region["pillars"]
+            for element in pillar["elements"]
+            for metric in element["metrics"]
+        ]
+
+    def get_base_condition_key(self, metric):
+        return (metric["metric_name"], metric["display_name"], metric["region_name"])
+
+    def get_existing(self, metrics, score_type, raw):
+        """
+        Fetches the existing metric BaseConditions, together with their
+        Conditions, in a single LEFT JOIN query.
+
+        Returns a tuple of dictionaries: base condition key -> BaseCondition,
+        and (base condition id, raster name) -> Condition.
+        """
+        region_names = {metric["region_name"] for metric in metrics}
+        rows = BaseCondition.objects.filter(
+            region_name__in=region_names,
+            condition_level=ConditionLevel.METRIC,
+        ).values(
+            "id",
+            "condition_name",
+            "display_name",
+            "region_name",
+            "condition__id",
+            "condition__raster_name",
+            "condition__condition_score_type",
+            "condition__is_raw",
         )
 
-        self.stdout.write(f"[OK] {metric['region_name']}:{metric['metric_name']}")
-
-        return condition
+        base_conditions = {}
+        conditions = {}
+        for row in rows:
+            key = (row["condition_name"], row["display_name"], row["region_name"])
+            base_conditions[key] = BaseCondition(
+                id=row["id"],
+                condition_name=row["condition_name"],
+                display_name=row["display_name"],
+                region_name=row["region_name"],
+                condition_level=ConditionLevel.METRIC,
+            )
+            if (
+                row["condition__id"] is None
+                or row["condition__condition_score_type"] != score_type
+                or row["condition__is_raw"] != raw
+            ):
+                continue
+            conditions[(row["id"], row["condition__raster_name"])] = Condition(
+                id=row["condition__id"],
+                condition_dataset_id=row["id"],
+                raster_name=row["condition__raster_name"],
+                condition_score_type=score_type,
+                is_raw=raw,
+            )
+
+        return base_conditions, conditions
+
+    def load_base_conditions(self, metrics, base_conditions, batch_size):
+        """
+        Inserts the BaseConditions missing from base_conditions with a single
+        bulk_create, and adds them to the dictionary.
+        """
+        missing = {}
+        for metric in metrics:
+            key = self.get_base_condition_key(metric)
+            if key in base_conditions or key in missing:
+                continue
+            missing[key] = BaseCondition(
+                condition_name=metric["metric_name"],
+                display_name=metric["display_name"],
+                region_name=metric["region_name"],
+                condition_level=ConditionLevel.METRIC,
+            )
+
+        BaseCondition.objects.bulk_create(missing.values(), batch_size=batch_size)
+        base_conditions.update(missing)
+        return base_conditions
+
+    def load_conditions(
+        self, metrics, base_conditions, conditions, score_type, raw, batch_size
+    ):
+        """
+        Returns one Condition per metric, inserting the ones missing from
+        conditions with a single bulk_create.
+        """
+        missing = {}
+        for metric in metrics:
+            base_condition = base_conditions[self.get_base_condition_key(metric)]
+            raster_name = metric["raw_data_download_path"]
+            key = (base_condition.pk, raster_name)
+            if key in conditions or key in missing:
+                continue
+            missing[key] = Condition(
+                condition_dataset=base_condition,
+                raster_name=raster_name,
+                condition_score_type=score_type,
+                is_raw=raw,
+            )
+
+        Condition.objects.bulk_create(missing.values(), batch_size=batch_size)
+        conditions.update(missing)
+
+        loaded = []
+        for metric in metrics:
+            base_condition = base_conditions[self.get_base_condition_key(metric)]
+            key = (base_condition.pk, metric["raw_data_download_path"])
+            loaded.append(conditions[key])
+
+        return loaded
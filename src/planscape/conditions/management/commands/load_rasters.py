@@ -23,10 +23,10 @@ class Command(BaseCommand):
     def handle(self, *args, **options):
         condition_ids = options.get("condition_ids")
         clear = options.get("clear")
+        # register_condition_raster reads the base condition to name the tiles.
+        conditions = Condition.objects.all().select_related("condition_dataset")
         if condition_ids:
-            conditions = Condition.objects.filter(id__in=condition_ids)
-        else:
-            conditions = Condition.objects.all()
+            conditions = conditions.filter(id__in=condition_ids)
 
         results = list(
             [self.handle_condition(condition, clear) for condition in conditions]
@@ -0,0 +1,16 @@
+# Generated by Django 4.1.11 on 2026-10-15 10:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("conditions", "0009_auto_20231222_0900"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="conditionraster",
+            index=models.Index(fields=["name"], name="condition_raster_name_index"),
+        ),
+    ]
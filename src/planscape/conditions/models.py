@@ -80,3 +80,14 @@ class ConditionRaster(models.Model):
         on_delete=models.CASCADE,
         related_name="raster_tiles",
     )
+
+    class Meta:
+        # get_rast_tile and the raster registry look up tiles by raster name.
+        indexes = [
+            models.Index(
+                fields=[
+                    "name",
+                ],
+                name="condition_raster_name_index",
+            )
+        ]
@@ -12,3 +12,24 @@ class ConditionTest(TestCase):
     def test_good_colormap(self):
         response = self.client.get(self._api_prefix + "/colormap/?colormap=viridis")
         self.assertEqual(response.status_code, 200)
+
+    def test_config_region(self):
+        response = self.client.get(
+            self._api_prefix + "/config/?region_name=sierra-nevada"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["region_name"], "sierra-nevada")
+
+    def test_config_bad_region(self):
+        response = self.client.get(self._api_prefix + "/config/?region_name=foo")
+        self.assertEqual(response.status_code, 400)
+
+    def test_config_missing_region(self):
+        response = self.client.get(self._api_prefix + "/config/")
+        self.assertEqual(response.status_code, 400)
+
+    def test_metrics_missing_metric_paths(self):
+        response = self.client.get(
+            self._api_prefix + "/metrics/?region_name=sierra-nevada"
+        )
+        self.assertEqual(response.status_code, 400)
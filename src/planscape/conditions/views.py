@@ -1,6 +1,7 @@
 import json
 import logging
 import os
+from functools import lru_cache
 
 from config.colormap_config import ColormapConfig
 from config.conditions_config import PillarConfig
@@ -13,6 +14,7 @@ from django.http import (
     QueryDict,
 )
 from django.conf import settings
+from django.views.decorators.cache import cache_page
 
 # Configure global logging.
 logger = logging.getLogger(__name__)
@@ -22,6 +24,9 @@ RASTER_TABLE = "conditions_conditionraster"
 RASTER_COLUMN = "raster"
 RASTER_NAME_COLUMN = "name"
 
+# Time to cache the condition config responses, in seconds.
+CACHE_TIME_IN_SECONDS = 60 * 60 * 2
+
 # Global variable for the PillarConfig, so that the configuration file is read once.
 pillar_config = PillarConfig(os.path.join(settings.BASE_DIR, "config/conditions.json"))
 
@@ -31,28 +36,34 @@ colormap_config = ColormapConfig(
 )
 
 
-def get_config(params: QueryDict):
-    # Get region name
-    assert isinstance(params["region_name"], str)
-    region_name = params["region_name"]
+@lru_cache(maxsize=1)
+def get_regions_by_name() -> dict:
+    """
+    Reads the conditions config once and indexes its regions by name.
+    Call get_regions_by_name.cache_clear() to force a re-read.
+    """
+    with open(settings.DEFAULT_CONDITIONS_FILE, "r") as f:
+        conditions_config = json.load(f)
+    return {region["region_name"]: region for region in conditions_config["regions"]}
 
-    # Read from conditions config
-    config_path = os.path.join(settings.BASE_DIR, "config/conditions.json")
-    conditions_config = json.load(open(config_path, "r"))
 
-    # Extract specific region data from JSON
-    for region in conditions_config["regions"]:
-        if region_name == region["region_name"]:
-            return region
+def get_config(params: QueryDict):
+    region_name = params.get("region_name", None)
+    if region_name is None:
+        return None
 
-    return None
+    return get_regions_by_name().get(region_name)
 
 
+@cache_page(CACHE_TIME_IN_SECONDS)
 def config(request: HttpRequest) -> HttpResponse:
     region = get_config(request.GET)
+    if region is None:
+        return HttpResponseBadRequest("Ill-formed request: bad region name")
     return JsonResponse(region)
 
 
+@cache_page(CACHE_TIME_IN_SECONDS)
 def metrics(request: HttpRequest) -> HttpResponse:
     """
     Gets a dictionary of metrics with their configurations to be used to format scenario results
@@ -65,29 +76,33 @@ def metrics(request: HttpRequest) -> HttpResponse:
     """
 
     params = request.GET
-    assert isinstance(params["region_name"], str)
-    region_name = params["region_name"]
-    assert isinstance(params["metric_paths"], str)
-    paths = json.loads(params["metric_paths"])
+    region_name = params.get("region_name", None)
+    metric_paths = params.get("metric_paths", None)
+    if region_name is None or metric_paths is None:
+        return HttpResponseBadRequest(
+            "Ill-formed request: region_name and metric_paths are required"
+        )
+    try:
+        paths = json.loads(metric_paths)
+    except json.JSONDecodeError:
+        return HttpResponseBadRequest("Ill-formed request: bad metric_paths")
 
     metric_dict = {}
-    config_path = os.path.join(settings.BASE_DIR, "config/conditions.json")
-    conditions_config = json.load(open(config_path, "r"))
-    for region in conditions_config["regions"]:
-        if region_name == region["region_name"]:
-            region_data = region
-            for pillar in region_data["pillars"]:
-                if pillar["pillar_name"] in paths["pillars"]:
-                    pillar_data = pillar
-                    for element in pillar_data["elements"]:
-                        if element["element_name"] in paths["elements"]:
-                            element_data = element
-                            for metric in element_data["metrics"]:
-                                if metric["metric_name"] in paths["metrics"]:
-                                    metric_dict[metric["metric_name"]] = metric
+    region_data = get_regions_by_name().get(region_name)
+    if region_data is not None:
+        for pillar in region_data["pillars"]:
+            if pillar["pillar_name"] in paths["pillars"]:
+                pillar_data = pillar
+                for element in pillar_data["elements"]:
+                    if element["element_name"] in paths["elements"]:
+                        element_data = element
+                        for metric in element_data["metrics"]:
+                            if metric["metric_name"] in paths["metrics"]:
+                                metric_dict[metric["metric_name"]] = metric
     return JsonResponse(metric_dict)
 
 
+@cache_page(CACHE_TIME_IN_SECONDS)
 def colormap(request: HttpRequest) -> HttpResponse:
     colormap = None
     colormap_name = request.GET.get("colormap", None)
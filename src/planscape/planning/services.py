@@ -1,10 +1,11 @@
+import io
 import math
 import os
 import zipfile
 import fiona
 from datetime import date, time, datetime
 from pathlib import Path
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, Iterator, Tuple
 from django.conf import settings
 from fiona.crs import from_epsg
 from django.contrib.gis.geos import GEOSGeometry
@@ -12,16 +13,54 @@ from planning.models import PlanningArea, Scenario, ScenarioResultStatus
 from stands.models import StandSizeChoices, area_from_size
 
 
-def zip_directory(file_obj, source_dir):
-    with zipfile.ZipFile(file_obj, "w", zipfile.ZIP_DEFLATED) as zipf:
+# Size of the reads used when streaming files into a zip archive.
+ZIP_STREAM_CHUNK_SIZE = 64 * 1024
+
+
+class _ZipOutputBuffer(io.RawIOBase):
+    """
+    Unseekable file object that holds whatever a ZipFile has written to it until
+    it is drained.  Being unseekable makes ZipFile write each entry in one pass.
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        self._buffer += b
+        return len(b)
+
+    def drain(self) -> bytes:
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+
+def stream_zip_directory(source_dir) -> Iterator[bytes]:
+    """
+    Zips source_dir, with archive names rooted at the directory's own name,
+    yielding the archive in pieces as it is compressed so that only one chunk of
+    it is held in memory at a time.
+    """
+    output = _ZipOutputBuffer()
+    with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as zipf:
         for root, _, files in os.walk(source_dir):
             for file in files:
-                zipf.write(
-                    os.path.join(root, file),
-                    os.path.relpath(
-                        os.path.join(root, file), os.path.join(source_dir, "..")
-                    ),
+                path = os.path.join(root, file)
+                zinfo = zipfile.ZipInfo.from_file(
+                    path, os.path.relpath(path, os.path.join(source_dir, ".."))
                 )
+                zinfo.compress_type = zipfile.ZIP_DEFLATED
+                with open(path, "rb") as source, zipf.open(zinfo, "w") as dest:
+                    while chunk := source.read(ZIP_STREAM_CHUNK_SIZE):
+                        dest.write(chunk)
+                        yield output.drain()
+                yield output.drain()
+    # Closing the archive writes its central directory.
+    yield output.drain()
 
 
 def get_max_treatable_area(configuration: Dict[str, Any]) -> float:
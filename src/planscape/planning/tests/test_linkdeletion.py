@@ -1,51 +1,40 @@
 import json
-import os
-from unittest import mock
-from django.db import connection
-from django.conf import settings
 from django.contrib.auth.models import User
-from django.contrib.gis.geos import GEOSGeometry, MultiPolygon, Polygon
-from django.test import TransactionTestCase
-from django.urls import reverse
+from django.test import TestCase
 
 from planning.models import SharedLink
 import planning.cron as cron
 from django.utils import timezone
 
 
-class DeleteOldLinksTest(TransactionTestCase):
-    def setUp(self):
-        self.user = User.objects.create(username="testuser")
-        self.user.set_password("12345")
-        self.user.save()
+class DeleteOldLinksTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username="testuser")
 
     def test_delete_old_links(self):
         one_month_ago = timezone.now() - timezone.timedelta(days=31)
         two_months_ago = timezone.now() - timezone.timedelta(days=61)
         two_years_ago = timezone.now() - timezone.timedelta(days=730)
-        link_today = SharedLink.objects.create(
-            user=self.user,
-            view_state=json.dumps({"ok": "test"}),
+        (
+            link_today,
+            link_one_month_old,
+            link_two_months_old,
+            link_two_years_old,
+        ) = SharedLink.objects.bulk_create(
+            [
+                SharedLink(user=self.user, view_state=json.dumps({"ok": "test"}))
+                for _ in range(4)
+            ]
         )
-        link_one_month_old = SharedLink.objects.create(
-            user=self.user,
-            view_state=json.dumps({"ok": "test"}),
-        )
-        link_two_months_old = SharedLink.objects.create(
-            user=self.user,
-            view_state=json.dumps({"ok": "test"}),
-        )
-        link_two_years_old = SharedLink.objects.create(
-            user=self.user,
-            view_state=json.dumps({"ok": "test"}),
-        )
-        link_today.save()
+        # created_at is set on insert, so backdate the older links afterwards.
         link_one_month_old.created_at = one_month_ago
-        link_one_month_old.save()
         link_two_months_old.created_at = two_months_ago
-        link_two_months_old.save()
         link_two_years_old.created_at = two_years_ago
-        link_two_years_old.save()
+        SharedLink.objects.bulk_update(
+            [link_one_month_old, link_two_months_old, link_two_years_old],
+            ["created_at"],
+        )
 
         self.assertEqual(SharedLink.objects.count(), 4)
 
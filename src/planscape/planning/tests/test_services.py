@@ -1,19 +1,25 @@
 from datetime import date, datetime
+import io
+import os
 import shutil
+import tempfile
+import zipfile
 from django.contrib.gis.geos import GEOSGeometry, MultiPolygon
-from django.test import TestCase, TransactionTestCase
+from django.test import TestCase
 import fiona
 from fiona.crs import to_string
 
 from planning.services import (
+    ZIP_STREAM_CHUNK_SIZE,
     export_to_shapefile,
     get_max_treatable_area,
     get_max_treatable_stand_count,
     get_schema,
+    stream_zip_directory,
     validate_scenario_treatment_ratio,
 )
 from planning.models import PlanningArea, Scenario, ScenarioResult, ScenarioResultStatus
-from stands.models import Stand, StandSizeChoices
+from stands.models import StandSizeChoices
 
 
 class MaxTreatableAreaTest(TestCase):
@@ -39,14 +45,15 @@ class MaxTreatableAreaTest(TestCase):
         self.assertEqual(2, stand_count)
 
 
-class ValidateScenarioTreatmentRatioTest(TransactionTestCase):
-    def setUp(self) -> None:
+class ValidateScenarioTreatmentRatioTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
         # Note: Test Polygon is 12163249.414195888 acres
-        self.test_poly = GEOSGeometry("POLYGON ((0 0, 0 2, 2 2, 2 0, 0 0))", srid=4269)
-        self.test_area = PlanningArea.objects.create(
+        cls.test_poly = GEOSGeometry("POLYGON ((0 0, 0 2, 2 2, 2 0, 0 0))", srid=4269)
+        cls.test_area = PlanningArea.objects.create(
             region_name="sierra-nevada",
             name="mytest",
-            geometry=MultiPolygon([self.test_poly]),
+            geometry=MultiPolygon([cls.test_poly]),
         )
 
     def get_basic_conf(self):
@@ -158,59 +165,41 @@ class GetSchemaTest(TestCase):
         self.assertEqual(5, len(schema["properties"]))
 
 
-class ExportToShapefileTest(TransactionTestCase):
-    def test_export_raises_value_error_failure(self):
+class ExportToShapefileTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
         unit_poly = GEOSGeometry(
             "MULTIPOLYGON (((0 0, 0 1, 1 1, 1 0, 0 0)))", srid=4269
         )
         planning = PlanningArea.objects.create(
             name="foo", region_name="sierra-nevada", geometry=unit_poly
         )
-        scenario = Scenario.objects.create(planning_area=planning, name="s1")
+        cls.scenario = Scenario.objects.create(planning_area=planning, name="s1")
+
+    def test_export_raises_value_error_failure(self):
         _ = ScenarioResult.objects.create(
-            scenario=scenario, status=ScenarioResultStatus.FAILURE
+            scenario=self.scenario, status=ScenarioResultStatus.FAILURE
         )
         with self.assertRaises(ValueError):
-            export_to_shapefile(scenario)
+            export_to_shapefile(self.scenario)
 
     def test_export_raises_value_error_pending(self):
-        unit_poly = GEOSGeometry(
-            "MULTIPOLYGON (((0 0, 0 1, 1 1, 1 0, 0 0)))", srid=4269
-        )
-        planning = PlanningArea.objects.create(
-            name="foo", region_name="sierra-nevada", geometry=unit_poly
-        )
-        scenario = Scenario.objects.create(planning_area=planning, name="s1")
         _ = ScenarioResult.objects.create(
-            scenario=scenario, status=ScenarioResultStatus.PENDING
+            scenario=self.scenario, status=ScenarioResultStatus.PENDING
         )
         with self.assertRaises(ValueError):
-            export_to_shapefile(scenario)
+            export_to_shapefile(self.scenario)
 
     def test_export_raises_value_error_running(self):
-        unit_poly = GEOSGeometry(
-            "MULTIPOLYGON (((0 0, 0 1, 1 1, 1 0, 0 0)))", srid=4269
-        )
-        planning = PlanningArea.objects.create(
-            name="foo", region_name="sierra-nevada", geometry=unit_poly
-        )
-        scenario = Scenario.objects.create(planning_area=planning, name="s1")
         _ = ScenarioResult.objects.create(
-            scenario=scenario, status=ScenarioResultStatus.RUNNING
+            scenario=self.scenario, status=ScenarioResultStatus.RUNNING
         )
         with self.assertRaises(ValueError):
-            export_to_shapefile(scenario)
+            export_to_shapefile(self.scenario)
 
     def test_export_creates_file(self):
-        unit_poly = GEOSGeometry(
-            "MULTIPOLYGON (((0 0, 0 1, 1 1, 1 0, 0 0)))", srid=4269
-        )
-        planning = PlanningArea.objects.create(
-            name="foo", region_name="sierra-nevada", geometry=unit_poly
-        )
-        scenario = Scenario.objects.create(planning_area=planning, name="s1")
         result = ScenarioResult.objects.create(
-            scenario=scenario,
+            scenario=self.scenario,
             status=ScenarioResultStatus.SUCCESS,
             result={
                 "type": "FeatureCollection",
@@ -231,10 +220,35 @@ class ExportToShapefileTest(TransactionTestCase):
                 ],
             },
         )
-        output = export_to_shapefile(scenario)
+        output = export_to_shapefile(self.scenario)
         self.assertIsNotNone(output)
         path = output / "s1.shp"
         with fiona.open(path, "r", "ESRI Shapefile") as source:
             self.assertEqual(1, len(source))
             self.assertEqual(to_string(source.crs), "EPSG:4326")
             shutil.rmtree(str(output))
+
+
+class StreamZipDirectoryTest(TestCase):
+    def setUp(self):
+        parent_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, parent_dir)
+        self.source_dir = os.path.join(parent_dir, "scenario")
+        os.makedirs(os.path.join(self.source_dir, "shapefile"))
+        # Spans several read chunks, so the archive is yielded in pieces.
+        self.data = os.urandom(3 * ZIP_STREAM_CHUNK_SIZE)
+        with open(os.path.join(self.source_dir, "data.bin"), "wb") as handle:
+            handle.write(self.data)
+        with open(os.path.join(self.source_dir, "shapefile", "empty.txt"), "w"):
+            pass
+
+    def test_streams_readable_zip(self):
+        chunks = list(stream_zip_directory(self.source_dir))
+        self.assertGreater(len(chunks), 3)
+        with zipfile.ZipFile(io.BytesIO(b"".join(chunks))) as zipf:
+            self.assertIsNone(zipf.testzip())
+            self.assertCountEqual(
+                zipf.namelist(), ["scenario/data.bin", "scenario/shapefile/empty.txt"]
+            )
+            self.assertEqual(zipf.read("scenario/data.bin"), self.data)
+            self.assertEqual(zipf.read("scenario/shapefile/empty.txt"), b"")
@@ -1,18 +1,57 @@
+import io
 import json
 import os
+import shutil
+import tempfile
+import zipfile
+from pathlib import Path
 from unittest import mock
 from django.db import connection
 from django.conf import settings
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
 from django.contrib.auth.models import User
+from django.contrib.sessions.backends.db import SessionStore
 from django.contrib.gis.geos import GEOSGeometry, MultiPolygon, Polygon
-from django.test import TransactionTestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 
 from planning.models import PlanningArea, Scenario, ScenarioResult, ScenarioResultStatus
 
 # Yes, we are pulling in an internal just for testing that a geometry write happened.
-from planning.views import _convert_polygon_to_multipolygon
+from planning.views import (
+    _convert_polygon_to_multipolygon,
+    get_treatment_goals_by_region_name,
+)
+
+# URLs of the planning endpoints under test, resolved once.
+_URL_CREATE_PLANNING_AREA = reverse("planning:create_planning_area")
+_URL_CREATE_SCENARIO = reverse("planning:create_scenario")
+_URL_CREATE_SHARED_LINK = reverse("planning:create_shared_link")
+_URL_DELETE_PLANNING_AREA = reverse("planning:delete_planning_area")
+_URL_DELETE_SCENARIO = reverse("planning:delete_scenario")
+_URL_DOWNLOAD_CSV = reverse("planning:download_csv")
+_URL_GET_PLANNING_AREA_BY_ID = reverse("planning:get_planning_area_by_id")
+_URL_GET_SCENARIO_BY_ID = reverse("planning:get_scenario_by_id")
+_URL_LIST_PLANNING_AREAS = reverse("planning:list_planning_areas")
+_URL_LIST_SCENARIOS_FOR_PLANNING_AREA = reverse(
+    "planning:list_scenarios_for_planning_area"
+)
+_URL_TREATMENT_GOALS_CONFIG = reverse("planning:treatment_goals_config")
+_URL_UPDATE_PLANNING_AREA = reverse("planning:update_planning_area")
+_URL_UPDATE_SCENARIO = reverse("planning:update_scenario")
+_URL_UPDATE_SCENARIO_RESULT = reverse("planning:update_scenario_result")
+
+# Most tests here store the same planning area geometry.  It is built directly,
+# rather than parsed from GeoJSON (which implies EPSG:4326), in the column's
+# SRID so that PostGIS doesn't transform it on every insert.
+_STORED_GEOMETRY = MultiPolygon(Polygon(((1, 2), (2, 3), (3, 4), (1, 2))), srid=4269)
+
+# Serial primary keys are never negative, so this never matches a row, however
+# many rows earlier runs against a kept (--keepdb) test database inserted.
+_NONEXISTENT_ID = -1
 
 # TODO: Add tests to ensure that users can't have planning areas with the same
 # name in the same region, and that users can't have scenarios with the same
@@ -39,19 +78,67 @@ def _create_planning_area(
         geometry=geometry,
         notes=notes,
     )
-    planning_area.save()
     return planning_area
 
 
+def _create_planning_areas(
+    user: User,
+    names: list[str],
+    geometry: GEOSGeometry | None = None,
+) -> list[PlanningArea]:
+    """
+    Creates a planning area for each name with a single INSERT.  All regions
+    are in Sierra Nevada.
+    """
+    return PlanningArea.objects.bulk_create(
+        [
+            PlanningArea(
+                user_id=user.pk,
+                name=name,
+                region_name="sierra-nevada",
+                geometry=geometry,
+            )
+            for name in names
+        ]
+    )
+
+
+def _create_session(user: User) -> str:
+    """
+    Creates a logged-in session for the user, as force_login does, and returns
+    its key.  Tests log in by setting it as the client's session cookie.
+    """
+    session = SessionStore()
+    session[SESSION_KEY] = user._meta.pk.value_to_string(user)
+    session[BACKEND_SESSION_KEY] = settings.AUTHENTICATION_BACKENDS[0]
+    session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+    session.save()
+    return session.session_key
+
+
+def _count_rows(*models) -> tuple[int, ...]:
+    """
+    Counts the rows in each model's table with a single query.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT "
+            + ", ".join(
+                "(SELECT COUNT(*) FROM %s)" % model._meta.db_table for model in models
+            )
+        )
+        return cursor.fetchone()
+
+
 #### PLAN(NING AREA) Tests ####
 
 
-class CreatePlanningAreaTest(TransactionTestCase):
-    def setUp(self):
-        self.user = User.objects.create(username="testuser")
-        self.user.set_password("12345")
-        self.user.save()
-        self.geometry = {
+class CreatePlanningAreaTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username="testuser")
+        cls.session_key = _create_session(cls.user)
+        cls.geometry = {
             "features": [
                 {
                     "geometry": {
@@ -61,7 +148,7 @@ class CreatePlanningAreaTest(TransactionTestCase):
                 }
             ]
         }
-        self.multipolygon_geometry = {
+        cls.multipolygon_geometry = {
             "features": [
                 {
                     "geometry": {
@@ -71,18 +158,41 @@ class CreatePlanningAreaTest(TransactionTestCase):
                 }
             ]
         }
-        self.notes = "Inconcievable!  You keep using that word. I do not think it means what you think it means."
-
-    def test_create_planning_area(self):
-        self.client.force_login(self.user)
-        response = self.client.post(
-            reverse("planning:create_planning_area"),
+        cls.notes = "Inconcievable!  You keep using that word. I do not think it means what you think it means."
+        # Request bodies shared across tests, encoded once.
+        cls.body = json.dumps(
             {
                 "name": "test plan",
                 "region_name": "Sierra Nevada",
-                "geometry": self.geometry,
-                "notes": self.notes,
-            },
+                "geometry": cls.geometry,
+            }
+        ).encode()
+        cls.body_with_notes = json.dumps(
+            {
+                "name": "test plan",
+                "region_name": "Sierra Nevada",
+                "geometry": cls.geometry,
+                "notes": cls.notes,
+            }
+        ).encode()
+        cls.multipolygon_body = json.dumps(
+            {
+                "name": "test plan",
+                "region_name": "Southern California",
+                "geometry": cls.multipolygon_geometry,
+            }
+        ).encode()
+        # Geometries the stored planning areas should match, parsed once.
+        cls.expected_geometry = _convert_polygon_to_multipolygon(cls.geometry)
+        cls.expected_multipolygon_geometry = _convert_polygon_to_multipolygon(
+            cls.multipolygon_geometry
+        )
+
+    def test_create_planning_area(self):
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
+        response = self.client.post(
+            _URL_CREATE_PLANNING_AREA,
+            self.body_with_notes,
             content_type="application/json",
         )
         self.assertEqual(response.status_code, 200)
@@ -91,11 +201,7 @@ class CreatePlanningAreaTest(TransactionTestCase):
         planning_area = planning_areas.first()
         assert planning_area is not None
         self.assertEqual(planning_area.region_name, "sierra-nevada")
-        self.assertTrue(
-            planning_area.geometry.equals(
-                _convert_polygon_to_multipolygon(self.geometry)
-            )
-        )
+        self.assertTrue(planning_area.geometry.equals(self.expected_geometry))
         self.assertEqual(planning_area.notes, self.notes)
         self.assertEqual(planning_area.name, "test plan")
         self.assertEqual(planning_area.user.pk, self.user.pk)
@@ -104,14 +210,10 @@ class CreatePlanningAreaTest(TransactionTestCase):
         )
 
     def test_create_planning_area_no_notes(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:create_planning_area"),
-            {
-                "name": "test plan",
-                "region_name": "Sierra Nevada",
-                "geometry": self.geometry,
-            },
+            _URL_CREATE_PLANNING_AREA,
+            self.body,
             content_type="application/json",
         )
         self.assertEqual(response.status_code, 200)
@@ -120,24 +222,16 @@ class CreatePlanningAreaTest(TransactionTestCase):
         planning_area = planning_areas.first()
         assert planning_area is not None
         self.assertEqual(planning_area.region_name, "sierra-nevada")
-        self.assertTrue(
-            planning_area.geometry.equals(
-                _convert_polygon_to_multipolygon(self.geometry)
-            )
-        )
+        self.assertTrue(planning_area.geometry.equals(self.expected_geometry))
         self.assertEqual(
             response.content, json.dumps({"id": planning_area.pk}).encode()
         )
 
     def test_create_planning_area_multipolygon(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:create_planning_area"),
-            {
-                "name": "test plan",
-                "region_name": "Southern California",
-                "geometry": self.multipolygon_geometry,
-            },
+            _URL_CREATE_PLANNING_AREA,
+            self.multipolygon_body,
             content_type="application/json",
         )
         self.assertEqual(response.status_code, 200)
@@ -147,135 +241,146 @@ class CreatePlanningAreaTest(TransactionTestCase):
         assert planning_area is not None
         self.assertEqual(planning_area.region_name, "southern-california")
         self.assertTrue(
-            planning_area.geometry.equals(
-                _convert_polygon_to_multipolygon(self.multipolygon_geometry)
-            )
+            planning_area.geometry.equals(self.expected_multipolygon_geometry)
         )
         self.assertEqual(
             response.content, json.dumps({"id": planning_area.pk}).encode()
         )
 
-    def test_missing_user(self):
-        response = self.client.post(
-            reverse("planning:create_planning_area"),
-            {
-                "name": "test plan",
-                "region_name": "Sierra Nevada",
-                "geometry": self.geometry,
-            },
-            content_type="application/json",
+    def test_convert_polygon_to_multipolygon(self):
+        geometry = _convert_polygon_to_multipolygon(
+            {"type": "Polygon", "coordinates": [[[1, 2], [2, 3], [3, 4], [1, 2]]]}
         )
-        self.assertEqual(response.status_code, 400)
+        self.assertEqual(geometry.geom_type, "MultiPolygon")
+        self.assertEqual(geometry.srid, 4326)
+        self.assertTrue(geometry.equals(_STORED_GEOMETRY))
 
-    def test_missing_name(self):
-        self.client.force_login(self.user)
-        response = self.client.post(
-            reverse("planning:create_planning_area"),
-            {"region_name": "Sierra Nevada", "geometry": self.geometry},
-            content_type="application/json",
-        )
-        self.assertEqual(response.status_code, 400)
+    def test_create_planning_area_bare_geometry(self):
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
+        geometries = {
+            "polygon": self.geometry["features"][0]["geometry"],
+            "multipolygon": self.multipolygon_geometry["features"][0]["geometry"],
+        }
+        for case, geometry in geometries.items():
+            with self.subTest(case):
+                response = self.client.post(
+                    _URL_CREATE_PLANNING_AREA,
+                    {
+                        "name": "test plan " + case,
+                        "region_name": "Sierra Nevada",
+                        "geometry": geometry,
+                    },
+                    content_type="application/json",
+                )
+                self.assertEqual(response.status_code, 200)
+                planning_area = PlanningArea.objects.get(pk=response.json()["id"])
+                self.assertTrue(planning_area.geometry.equals(self.expected_geometry))
 
-    def test_missing_geometry(self):
-        self.client.force_login(self.user)
+    @override_settings(MAX_GEOMETRY_VERTICES=3)
+    def test_create_planning_area_too_many_vertices(self):
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:create_planning_area"),
-            {"name": "test plan", "region_name": "Sierra Nevada"},
+            _URL_CREATE_PLANNING_AREA,
+            self.body,
             content_type="application/json",
         )
-        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.status_code, 413)
+        self.assertEqual(PlanningArea.objects.count(), 0)
 
-    def test_missing_geometry_features(self):
-        self.client.force_login(self.user)
+    def test_create_planning_area_malformed_coordinates(self):
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
+        malformed_coordinates = {
+            "position": [1, 2],
+            "ring": [[1, 2], [3, 4]],
+            "short_position": [[[1]]],
+            "non_numeric_position": [[["a", "b"], [3, 4]]],
+        }
+        for case, coordinates in malformed_coordinates.items():
+            with self.subTest(case):
+                response = self.client.post(
+                    _URL_CREATE_PLANNING_AREA,
+                    {
+                        "name": "test plan",
+                        "region_name": "Sierra Nevada",
+                        "geometry": {"type": "Polygon", "coordinates": coordinates},
+                    },
+                    content_type="application/json",
+                )
+                self.assertEqual(response.status_code, 400)
+                self.assertRegex(str(response.content), r"Could not parse geometry")
+        self.assertEqual(PlanningArea.objects.count(), 0)
+
+    def test_missing_user(self):
         response = self.client.post(
-            reverse("planning:create_planning_area"),
-            {"name": "test plan", "region_name": "Sierra Nevada", "geometry": {}},
+            _URL_CREATE_PLANNING_AREA,
+            self.body,
             content_type="application/json",
         )
         self.assertEqual(response.status_code, 400)
 
-    def test_empty_features(self):
-        self.client.force_login(self.user)
-        response = self.client.post(
-            reverse("planning:create_planning_area"),
-            {
+    def test_bad_requests(self):
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
+        bad_requests = {
+            "missing_name": {"region_name": "Sierra Nevada", "geometry": self.geometry},
+            "missing_geometry": {"name": "test plan", "region_name": "Sierra Nevada"},
+            "missing_geometry_features": {
+                "name": "test plan",
+                "region_name": "Sierra Nevada",
+                "geometry": {},
+            },
+            "empty_features": {
                 "name": "test plan",
                 "region_name": "Sierra Nevada",
                 "geometry": {"features": []},
             },
-            content_type="application/json",
-        )
-        self.assertEqual(response.status_code, 400)
-
-    def test_bad_geometry(self):
-        self.client.force_login(self.user)
-        response = self.client.post(
-            reverse("planning:create_planning_area"),
-            {
+            "bad_geometry": {
                 "name": "test plan",
                 "region_name": "Sierra Nevada",
                 "geometry": {"features": [{"type": "Point", "coordinates": [1, 2]}]},
             },
-            content_type="application/json",
-        )
-        self.assertEqual(response.status_code, 400)
-
-    def test_bad_polygon(self):
-        self.client.force_login(self.user)
-        response = self.client.post(
-            reverse("planning:create_planning_area"),
-            {
+            "bad_polygon": {
                 "name": "test plan",
                 "region_name": "Sierra Nevada",
                 "geometry": {"features": [{"geometry": {"type": "Polygon"}}]},
             },
-            content_type="application/json",
-        )
-        self.assertEqual(response.status_code, 400)
-
-    def test_bad_region_name(self):
-        self.client.force_login(self.user)
-        response = self.client.post(
-            reverse("planning:create_planning_area"),
-            {
+            "bare_point": {
+                "name": "test plan",
+                "region_name": "Sierra Nevada",
+                "geometry": {"type": "Point", "coordinates": [1, 2]},
+            },
+            "bad_region_name": {
                 "name": "test plan",
                 "region_name": "north_coast_inland",
-                "geometry": {
-                    "features": [
-                        {
-                            "geometry": {
-                                "type": "MultiPolygon",
-                                "coordinates": [[[[1, 2], [2, 3], [3, 4], [1, 2]]]],
-                            }
-                        }
-                    ]
-                },
+                "geometry": self.multipolygon_geometry,
             },
-            content_type="application/json",
-        )
-        self.assertEqual(response.status_code, 400)
+        }
+        for case, body in bad_requests.items():
+            with self.subTest(case):
+                response = self.client.post(
+                    _URL_CREATE_PLANNING_AREA, body, content_type="application/json"
+                )
+                self.assertEqual(response.status_code, 400)
+        self.assertEqual(PlanningArea.objects.count(), 0)
 
 
-class DeletePlanningAreaTest(TransactionTestCase):
-    def setUp(self):
-        self.user = User.objects.create(username="testuser")
-        self.user.set_password("12345")
-        self.user.save()
+class DeletePlanningAreaTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username="testuser")
+        cls.session_key = _create_session(cls.user)
 
-        self.planning_area1 = _create_planning_area(self.user, "test plan1", None)
-        self.planning_area2 = _create_planning_area(self.user, "test plan2", None)
+        cls.planning_area1 = _create_planning_area(cls.user, "test plan1", None)
+        cls.planning_area2 = _create_planning_area(cls.user, "test plan2", None)
 
-        self.user2 = User.objects.create(username="testuser2")
-        self.user2.set_password("12345")
-        self.user2.save()
+        cls.user2 = User.objects.create(username="testuser2")
 
-        self.planning_area3 = _create_planning_area(self.user2, "test plan3", None)
+        cls.planning_area3 = _create_planning_area(cls.user2, "test plan3", None)
 
     def test_delete(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         self.assertEqual(PlanningArea.objects.count(), 3)
         response = self.client.post(
-            reverse("planning:delete_planning_area"),
+            _URL_DELETE_PLANNING_AREA,
             {"id": self.planning_area2.pk},
             content_type="application/json",
         )
@@ -287,7 +392,7 @@ class DeletePlanningAreaTest(TransactionTestCase):
 
     def test_delete_user_not_logged_in(self):
         response = self.client.post(
-            reverse("planning:delete_planning_area"),
+            _URL_DELETE_PLANNING_AREA,
             {"id": self.planning_area1.pk},
             content_type="application/json",
         )
@@ -297,10 +402,10 @@ class DeletePlanningAreaTest(TransactionTestCase):
 
     # Deleteing someone else's plan silently performs nothing.
     def test_delete_wrong_user(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
 
         response = self.client.post(
-            reverse("planning:delete_planning_area"),
+            _URL_DELETE_PLANNING_AREA,
             {"id": self.planning_area3.pk},
             content_type="application/json",
         )
@@ -309,7 +414,7 @@ class DeletePlanningAreaTest(TransactionTestCase):
 
     # Only the user's own plans are deleted.
     def test_delete_multiple_planning_areas_with_some_owner_mismatches(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         self.assertEqual(PlanningArea.objects.count(), 3)
         planning_area_ids = [
             self.planning_area1.pk,
@@ -317,7 +422,7 @@ class DeletePlanningAreaTest(TransactionTestCase):
             self.planning_area3.pk,
         ]
         response = self.client.post(
-            reverse("planning:delete_planning_area"),
+            _URL_DELETE_PLANNING_AREA,
             {"id": planning_area_ids},
             content_type="application/json",
         )
@@ -325,11 +430,11 @@ class DeletePlanningAreaTest(TransactionTestCase):
         self.assertEqual(PlanningArea.objects.count(), 1)
 
     def test_delete_multiple_planning_areas(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         self.assertEqual(PlanningArea.objects.count(), 3)
         planning_area_ids = [self.planning_area1.pk, self.planning_area2.pk]
         response = self.client.post(
-            reverse("planning:delete_planning_area"),
+            _URL_DELETE_PLANNING_AREA,
             {"id": planning_area_ids},
             content_type="application/json",
         )
@@ -339,37 +444,43 @@ class DeletePlanningAreaTest(TransactionTestCase):
         )
         self.assertEqual(PlanningArea.objects.count(), 1)
 
+    def test_delete_does_not_fetch_geometry(self):
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                _URL_DELETE_PLANNING_AREA,
+                {"id": self.planning_area1.pk},
+                content_type="application/json",
+            )
+        self.assertEqual(response.status_code, 200)
+        for query in queries.captured_queries:
+            self.assertNotIn('"geometry"', query["sql"])
+        self.assertEqual(PlanningArea.objects.count(), 2)
 
-class UpdatePlanningAreaTest(TransactionTestCase):
-    def setUp(self):
-        self.user = User.objects.create(username="testuser")
-        self.user.set_password("12345")
-        self.user.save()
-        self.geometry = {
-            "type": "MultiPolygon",
-            "coordinates": [[[[1, 2], [2, 3], [3, 4], [1, 2]]]],
-        }
-        storable_geometry = GEOSGeometry(json.dumps(self.geometry))
-        self.old_name = "Westley"
-        self.old_notes = "I know something you don't know."
-        self.planning_area = _create_planning_area(
-            self.user, self.old_name, storable_geometry, self.old_notes
+
+class UpdatePlanningAreaTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username="testuser")
+        cls.session_key = _create_session(cls.user)
+        cls.old_name = "Westley"
+        cls.old_notes = "I know something you don't know."
+        cls.planning_area = _create_planning_area(
+            cls.user, cls.old_name, _STORED_GEOMETRY, cls.old_notes
         )
 
-        self.user2 = User.objects.create(username="testuser2")
-        self.user2.set_password("12345")
-        self.user2.save()
-        self.planning_area2 = _create_planning_area(
-            self.user2, "test plan2", storable_geometry, self.old_notes
+        cls.user2 = User.objects.create(username="testuser2")
+        cls.planning_area2 = _create_planning_area(
+            cls.user2, "test plan2", _STORED_GEOMETRY, cls.old_notes
         )
 
-        self.new_name = "Inigo"
-        self.new_notes = "I am not left handed."
+        cls.new_name = "Inigo"
+        cls.new_notes = "I am not left handed."
 
     def test_update_notes_and_name(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:update_planning_area"),
+            _URL_UPDATE_PLANNING_AREA,
             {
                 "id": self.planning_area.pk,
                 "name": self.new_name,
@@ -386,9 +497,9 @@ class UpdatePlanningAreaTest(TransactionTestCase):
         self.assertEqual(planning_area.notes, self.new_notes)
 
     def test_update_notes_only(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:update_planning_area"),
+            _URL_UPDATE_PLANNING_AREA,
             {"id": self.planning_area.pk, "notes": self.new_notes},
             content_type="application/json",
         )
@@ -401,9 +512,9 @@ class UpdatePlanningAreaTest(TransactionTestCase):
         self.assertEqual(planning_area.notes, self.new_notes)
 
     def test_update_name_only(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:update_planning_area"),
+            _URL_UPDATE_PLANNING_AREA,
             {"id": self.planning_area.pk, "name": self.new_name},
             content_type="application/json",
         )
@@ -416,9 +527,9 @@ class UpdatePlanningAreaTest(TransactionTestCase):
         self.assertEqual(planning_area.notes, self.old_notes)
 
     def test_update_clear_notes(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:update_planning_area"),
+            _URL_UPDATE_PLANNING_AREA,
             {"id": self.planning_area.pk, "notes": None},
             content_type="application/json",
         )
@@ -431,9 +542,9 @@ class UpdatePlanningAreaTest(TransactionTestCase):
         self.assertEqual(planning_area.notes, None)
 
     def test_update_empty_string_notes(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:update_planning_area"),
+            _URL_UPDATE_PLANNING_AREA,
             {"id": self.planning_area.pk, "notes": ""},
             content_type="application/json",
         )
@@ -445,10 +556,25 @@ class UpdatePlanningAreaTest(TransactionTestCase):
         self.assertEqual(planning_area.name, self.old_name)
         self.assertEqual(planning_area.notes, "")
 
+    def test_update_does_not_fetch_geometry(self):
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                _URL_UPDATE_PLANNING_AREA,
+                {"id": self.planning_area.pk, "name": self.new_name},
+                content_type="application/json",
+            )
+        self.assertEqual(response.status_code, 200)
+        for query in queries.captured_queries:
+            self.assertNotIn('"geometry"', query["sql"])
+        planning_area = PlanningArea.objects.get(pk=self.planning_area.pk)
+        self.assertEqual(planning_area.name, self.new_name)
+        self.assertTrue(planning_area.geometry.equals(_STORED_GEOMETRY))
+
     def test_update_nothing_to_update(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:update_planning_area"),
+            _URL_UPDATE_PLANNING_AREA,
             {"id": self.planning_area.pk},
             content_type="application/json",
         )
@@ -462,7 +588,7 @@ class UpdatePlanningAreaTest(TransactionTestCase):
 
     def test_update_not_logged_in(self):
         response = self.client.post(
-            reverse("planning:update_planning_area"),
+            _URL_UPDATE_PLANNING_AREA,
             {
                 "id": self.planning_area.pk,
                 "name": self.new_name,
@@ -474,9 +600,9 @@ class UpdatePlanningAreaTest(TransactionTestCase):
         self.assertRegex(str(response.content), r"User must be logged in")
 
     def test_update_missing_id(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:update_planning_area"),
+            _URL_UPDATE_PLANNING_AREA,
             {"name": self.new_name, "notes": self.new_notes},
             content_type="application/json",
         )
@@ -484,9 +610,9 @@ class UpdatePlanningAreaTest(TransactionTestCase):
         self.assertRegex(str(response.content), r"No PlanningArea matches")
 
     def test_update_wrong_user(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:update_planning_area"),
+            _URL_UPDATE_PLANNING_AREA,
             {
                 "id": self.planning_area2.pk,
                 "name": self.new_name,
@@ -498,9 +624,9 @@ class UpdatePlanningAreaTest(TransactionTestCase):
         self.assertRegex(str(response.content), r"No PlanningArea matches")
 
     def test_update_blank_name(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:update_planning_area"),
+            _URL_UPDATE_PLANNING_AREA,
             {"id": self.planning_area.pk, "name": None, "notes": self.new_notes},
             content_type="application/json",
         )
@@ -508,9 +634,9 @@ class UpdatePlanningAreaTest(TransactionTestCase):
         self.assertRegex(str(response.content), r"name must be defined")
 
     def test_update_empty_string_name(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:update_planning_area"),
+            _URL_UPDATE_PLANNING_AREA,
             {"id": self.planning_area.pk, "name": "", "notes": self.new_notes},
             content_type="application/json",
         )
@@ -518,33 +644,24 @@ class UpdatePlanningAreaTest(TransactionTestCase):
         self.assertRegex(str(response.content), r"name must be defined")
 
 
-class GetPlanningAreaTest(TransactionTestCase):
-    def setUp(self):
-        self.user = User.objects.create(username="testuser")
-        self.user.set_password("12345")
-        self.user.save()
-        self.geometry = {
-            "type": "MultiPolygon",
-            "coordinates": [[[[1, 2], [2, 3], [3, 4], [1, 2]]]],
-        }
-        storable_geometry = GEOSGeometry(json.dumps(self.geometry))
-        self.planning_area = _create_planning_area(
-            self.user, "test plan", storable_geometry
+class GetPlanningAreaTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username="testuser")
+        cls.session_key = _create_session(cls.user)
+        cls.planning_area = _create_planning_area(
+            cls.user, "test plan", _STORED_GEOMETRY
         )
 
-        self.user2 = User.objects.create(username="testuser2")
-        self.user2.set_password("12345")
-        self.user2.save()
-        self.planning_area2 = _create_planning_area(
-            self.user2, "test plan2", storable_geometry
+        cls.user2 = User.objects.create(username="testuser2")
+        cls.planning_area2 = _create_planning_area(
+            cls.user2, "test plan2", _STORED_GEOMETRY
         )
 
     def test_get_planning_area(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.get(
-            reverse("planning:get_planning_area_by_id"),
-            {"id": self.planning_area.pk},
-            content_type="application/json",
+            _URL_GET_PLANNING_AREA_BY_ID, {"id": self.planning_area.pk}
         )
         self.assertEqual(response.status_code, 200)
         returned_planning_area = response.json()
@@ -552,104 +669,110 @@ class GetPlanningAreaTest(TransactionTestCase):
         self.assertEqual(returned_planning_area["region_name"], "Sierra Nevada")
         self.assertIsNotNone(returned_planning_area["created_at"])
 
+    def test_get_planning_area_not_modified(self):
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
+        response = self.client.get(
+            _URL_GET_PLANNING_AREA_BY_ID, {"id": self.planning_area.pk}
+        )
+        self.assertEqual(response.status_code, 200)
+        etag = response.headers["ETag"]
+
+        response = self.client.get(
+            _URL_GET_PLANNING_AREA_BY_ID,
+            {"id": self.planning_area.pk},
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+        # Adding a scenario changes the planning area's details.
+        _create_scenario(self.planning_area, "test scenario", "{}")
+        response = self.client.get(
+            _URL_GET_PLANNING_AREA_BY_ID,
+            {"id": self.planning_area.pk},
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["scenario_count"], 1)
+
     def test_get_nonexistent_planning_area(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.get(
-            reverse("planning:get_planning_area_by_id"),
-            {"id": 9999},
-            content_type="application/json",
+            _URL_GET_PLANNING_AREA_BY_ID, {"id": _NONEXISTENT_ID}
         )
         self.assertEqual(response.status_code, 400)
         self.assertRegex(str(response.content), r"No PlanningArea matches")
 
     def test_get_planning_area_wrong_user(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.get(
-            reverse("planning:get_planning_area_by_id"),
-            {"id": self.planning_area2.pk},
-            content_type="application/json",
+            _URL_GET_PLANNING_AREA_BY_ID, {"id": self.planning_area2.pk}
         )
         self.assertEqual(response.status_code, 400)
         self.assertRegex(str(response.content), r"No PlanningArea matches")
 
     def test_get_planning_area_not_logged_in(self):
         response = self.client.get(
-            reverse("planning:get_planning_area_by_id"),
-            {"id": self.planning_area.pk},
-            content_type="application/json",
+            _URL_GET_PLANNING_AREA_BY_ID, {"id": self.planning_area.pk}
         )
         self.assertEqual(response.status_code, 400)
         self.assertRegex(str(response.content), r"User must be logged in")
 
 
-class ListPlanningAreaTest(TransactionTestCase):
-    def setUp(self):
-        self.user = User.objects.create(username="testuser")
-        self.user.set_password("12345")
-        self.user.save()
-        self.geometry = {
-            "type": "MultiPolygon",
-            "coordinates": [[[[1, 2], [2, 3], [3, 4], [1, 2]]]],
-        }
-        stored_geometry = GEOSGeometry(json.dumps(self.geometry))
-        self.planning_area1 = _create_planning_area(
-            self.user, "test plan1", stored_geometry
-        )
-        self.planning_area2 = _create_planning_area(
-            self.user, "test plan2", stored_geometry
-        )
-        self.planning_area3 = _create_planning_area(
-            self.user, "test plan3", stored_geometry
-        )
-        self.planning_area4 = _create_planning_area(
-            self.user, "test plan4", stored_geometry
-        )
-        self.planning_area5 = _create_planning_area(
-            self.user, "test plan5", stored_geometry
-        )
-        self.scenario1_1 = _create_scenario(
-            self.planning_area1, "test pa1 scenario1 ", "{}", ""
-        )
-        self.scenario1_2 = _create_scenario(
-            self.planning_area1, "test pa1 scenario2", "{}", ""
-        )
-        self.scenario1_3 = _create_scenario(
-            self.planning_area1, "test pa1 scenario3", "{}", ""
-        )
-        self.scenario3_1 = _create_scenario(
-            self.planning_area3, "test pa3 scenario1", "{}", ""
-        )
-        self.scenario4_1 = _create_scenario(
-            self.planning_area4, "test pa4 scenario1 ", "{}", ""
-        )
-        self.scenario4_2 = _create_scenario(
-            self.planning_area4, "test pa4 scenario2", "{}", ""
-        )
-        self.scenario4_3 = _create_scenario(
-            self.planning_area4, "test pa4 scenario3", "{}", ""
+class ListPlanningAreaTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username="testuser")
+        cls.session_key = _create_session(cls.user)
+        (
+            cls.planning_area1,
+            cls.planning_area2,
+            cls.planning_area3,
+            cls.planning_area4,
+            cls.planning_area5,
+        ) = _create_planning_areas(
+            cls.user,
+            ["test plan1", "test plan2", "test plan3", "test plan4", "test plan5"],
+            _STORED_GEOMETRY,
+        )
+        (
+            cls.scenario1_1,
+            cls.scenario1_2,
+            cls.scenario1_3,
+            cls.scenario3_1,
+            cls.scenario4_1,
+            cls.scenario4_2,
+            cls.scenario4_3,
+        ) = _create_scenarios(
+            [
+                (cls.planning_area1, "test pa1 scenario1 "),
+                (cls.planning_area1, "test pa1 scenario2"),
+                (cls.planning_area1, "test pa1 scenario3"),
+                (cls.planning_area3, "test pa3 scenario1"),
+                (cls.planning_area4, "test pa4 scenario1 "),
+                (cls.planning_area4, "test pa4 scenario2"),
+                (cls.planning_area4, "test pa4 scenario3"),
+            ],
+            "{}",
+            "",
         )
 
-        self.user2 = User.objects.create(username="testuser2")
-        self.user2.set_password("12345")
-        self.user2.save()
-        self.geometry = {
-            "type": "MultiPolygon",
-            "coordinates": [[[[1, 2], [2, 3], [3, 4], [1, 2]]]],
-        }
-        stored_geometry = GEOSGeometry(json.dumps(self.geometry))
-        self.planning_area6 = _create_planning_area(
-            self.user2, "test plan3", stored_geometry
+        cls.user2 = User.objects.create(username="testuser2")
+        cls.planning_area6 = _create_planning_area(
+            cls.user2, "test plan3", _STORED_GEOMETRY
         )
 
-        self.emptyuser = User.objects.create(username="emptyuser")
-        self.emptyuser.set_password("12345")
-        self.emptyuser.save()
+        cls.emptyuser = User.objects.create(username="emptyuser")
+        cls.emptyuser_session_key = _create_session(cls.emptyuser)
+
+    def setUp(self):
+        super().setUp()
+        # Rendered lists are cached per user, and these users live across tests.
+        cache.clear()
 
     def test_list_planning_areas(self):
-        self.client.force_login(self.user)
-        response = self.client.get(
-            reverse("planning:list_planning_areas"), {}, content_type="application/json"
-        )
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
+        response = self.client.get(_URL_LIST_PLANNING_AREAS, {})
         planning_areas = json.loads(response.content)
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(planning_areas), 5)
@@ -659,6 +782,80 @@ class ListPlanningAreaTest(TransactionTestCase):
         self.assertIsNotNone(planning_areas[1]["latest_updated"])
         self.assertIsNotNone(planning_areas[0]["created_at"])
 
+    def test_list_planning_areas_cached(self):
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
+        with CaptureQueriesContext(connection) as uncached_queries:
+            response = self.client.get(_URL_LIST_PLANNING_AREAS, {})
+        self.assertEqual(response.status_code, 200)
+        planning_areas = response.json()
+
+        # Only the query checking for changes runs again, not the list query.
+        with CaptureQueriesContext(connection) as cached_queries:
+            response = self.client.get(_URL_LIST_PLANNING_AREAS, {})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), planning_areas)
+        self.assertEqual(len(cached_queries), len(uncached_queries) - 1)
+        # In particular, the summary query runs only once per request.
+        cached_sql = [query["sql"] for query in cached_queries]
+        self.assertEqual(len(set(cached_sql)), len(cached_sql))
+
+    def test_list_planning_areas_matches_get_planning_area(self):
+        # Real coordinates carry more than the 8 decimal places AsGeoJSON rounds to
+        # by default.
+        _create_planning_area(
+            self.user,
+            "test plan precise",
+            MultiPolygon(
+                Polygon(
+                    (
+                        (-120.123456789012, 38.987654321098),
+                        (-120.023456789012, 38.987654321098),
+                        (-120.023456789012, 39.087654321098),
+                        (-120.123456789012, 38.987654321098),
+                    )
+                ),
+                srid=4269,
+            ),
+        )
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
+        response = self.client.get(_URL_LIST_PLANNING_AREAS, {})
+        self.assertEqual(response.status_code, 200)
+        for listed_planning_area in response.json():
+            with self.subTest(listed_planning_area["name"]):
+                response = self.client.get(
+                    _URL_GET_PLANNING_AREA_BY_ID, {"id": listed_planning_area["id"]}
+                )
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(listed_planning_area, response.json())
+
+    def test_list_planning_areas_without_geometry(self):
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(
+                _URL_LIST_PLANNING_AREAS, {"add_geometry": "false"}
+            )
+        self.assertEqual(response.status_code, 200)
+        planning_areas = response.json()
+        self.assertEqual(len(planning_areas), 5)
+        for planning_area in planning_areas:
+            self.assertNotIn("geometry", planning_area)
+        self.assertEqual(planning_areas[0]["scenario_count"], 3)
+        for query in queries:
+            self.assertNotIn('"geometry"', query["sql"])
+
+    def test_list_planning_areas_query_count(self):
+        # Scenario counts and dates are aggregated in the listing query, so
+        # the number of queries must not grow with planning areas or scenarios.
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.emptyuser_session_key
+        with CaptureQueriesContext(connection) as empty_list_queries:
+            response = self.client.get(_URL_LIST_PLANNING_AREAS, {})
+        self.assertEqual(len(response.json()), 0)
+
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
+        with self.assertNumQueries(len(empty_list_queries)):
+            response = self.client.get(_URL_LIST_PLANNING_AREAS, {})
+        self.assertEqual(len(response.json()), 5)
+
     def test_list_planning_areas_ordered(self):
         ## This tests the logic for ordering areas by most recent scenario date,
         #   or by the plan's most recent update, if it has no scenario
@@ -701,10 +898,8 @@ class ListPlanningAreaTest(TransactionTestCase):
                     "UPDATE planning_planningarea SET updated_at = %s WHERE id = %s", p
                 )
 
-        self.client.force_login(self.user)
-        response = self.client.get(
-            reverse("planning:list_planning_areas"), {}, content_type="application/json"
-        )
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
+        response = self.client.get(_URL_LIST_PLANNING_AREAS, {})
         planning_areas = json.loads(response.content)
         updates_list = [(pa["name"], pa["latest_updated"]) for pa in planning_areas]
         self.assertEqual(
@@ -718,18 +913,34 @@ class ListPlanningAreaTest(TransactionTestCase):
             ],
         )
 
-    def test_list_planning_areas_not_logged_in(self):
+    def test_list_planning_areas_not_modified(self):
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
+        response = self.client.get(_URL_LIST_PLANNING_AREAS, {})
+        self.assertEqual(response.status_code, 200)
+        etag = response.headers["ETag"]
+
         response = self.client.get(
-            reverse("planning:list_planning_areas"), {}, content_type="application/json"
+            _URL_LIST_PLANNING_AREAS, {}, HTTP_IF_NONE_MATCH=etag
         )
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+        # Deleting a planning area without scenarios changes no remaining timestamps.
+        self.planning_area2.delete()
+        response = self.client.get(
+            _URL_LIST_PLANNING_AREAS, {}, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 4)
+
+    def test_list_planning_areas_not_logged_in(self):
+        response = self.client.get(_URL_LIST_PLANNING_AREAS, {})
         self.assertEqual(response.status_code, 400)
         self.assertRegex(str(response.content), r"User must be logged in")
 
     def test_list_planning_areas_empty_user(self):
-        self.client.force_login(self.emptyuser)
-        response = self.client.get(
-            reverse("planning:list_planning_areas"), {}, content_type="application/json"
-        )
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.emptyuser_session_key
+        response = self.client.get(_URL_LIST_PLANNING_AREAS, {})
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.json()), 0)
 
@@ -738,17 +949,18 @@ class ListPlanningAreaTest(TransactionTestCase):
 # tests what was stored, and then deletes everything.
 # This covers the basic happiest of cases and should not be a substitute
 # for the main unit tests.
-class EndtoEndPlanningAreaAndScenarioTest(TransactionTestCase):
-    def setUp(self):
-        self.user = User.objects.create(username="testuser")
-        self.user.set_password("12345")
-        self.user.save()
-        self.internal_geometry = {
+@override_settings(USE_CELERY_FOR_FORSYS=False)
+class EndtoEndPlanningAreaAndScenarioTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username="testuser")
+        cls.session_key = _create_session(cls.user)
+        cls.internal_geometry = {
             "type": "MultiPolygon",
             "coordinates": [[[[1, 2], [2, 3], [3, 4], [1, 2]]]],
         }
-        self.geometry = {"features": [{"geometry": self.internal_geometry}]}
-        self.scenario_configuration = {
+        cls.geometry = {"features": [{"geometry": cls.internal_geometry}]}
+        cls.scenario_configuration = {
             "question_id": 1,
             "weights": [],
             "est_cost": 2000,
@@ -769,18 +981,16 @@ class EndtoEndPlanningAreaAndScenarioTest(TransactionTestCase):
         return_value=(True, "all good"),
     )
     def test_end_to_end(self, validation):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
 
         # List - returns 0
-        response = self.client.get(
-            reverse("planning:list_planning_areas"), {}, content_type="application/json"
-        )
+        response = self.client.get(_URL_LIST_PLANNING_AREAS, {})
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.json()), 0)
 
         # insert one
         response = self.client.post(
-            reverse("planning:create_planning_area"),
+            _URL_CREATE_PLANNING_AREA,
             {
                 "name": "test plan",
                 "region_name": "Sierra Nevada",
@@ -792,9 +1002,7 @@ class EndtoEndPlanningAreaAndScenarioTest(TransactionTestCase):
         self.assertEqual(PlanningArea.objects.count(), 1)
 
         # is it there?
-        response = self.client.get(
-            reverse("planning:list_planning_areas"), {}, content_type="application/json"
-        )
+        response = self.client.get(_URL_LIST_PLANNING_AREAS, {})
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.json()), 1)
         planning_areas = response.json()
@@ -803,20 +1011,24 @@ class EndtoEndPlanningAreaAndScenarioTest(TransactionTestCase):
 
         # get plan details
         response = self.client.get(
-            reverse("planning:get_planning_area_by_id"),
-            {"id": listed_planning_area["id"]},
-            content_type="application/json",
+            _URL_GET_PLANNING_AREA_BY_ID, {"id": listed_planning_area["id"]}
         )
         self.assertEqual(response.status_code, 200)
         planning_area = response.json()
-        self.assertEqual(planning_area["name"], "test plan")
-        self.assertEqual(planning_area["region_name"], "Sierra Nevada")
-        self.assertEqual(planning_area["id"], listed_planning_area["id"])
-        self.assertEqual(planning_area["geometry"], self.internal_geometry)
+        expected_planning_area = {
+            "id": listed_planning_area["id"],
+            "name": "test plan",
+            "region_name": "Sierra Nevada",
+            "geometry": self.internal_geometry,
+        }
+        self.assertEqual(
+            {key: planning_area[key] for key in expected_planning_area},
+            expected_planning_area,
+        )
 
         # create a scenario
         response = self.client.post(
-            reverse("planning:create_scenario"),
+            _URL_CREATE_SCENARIO,
             {
                 "planning_area": listed_planning_area["id"],
                 "configuration": self.scenario_configuration,
@@ -828,8 +1040,7 @@ class EndtoEndPlanningAreaAndScenarioTest(TransactionTestCase):
         self.assertEqual(response.status_code, 200)
         output = response.json()
         scenario_id = output["id"]
-        self.assertEqual(Scenario.objects.count(), 1)
-        self.assertEqual(ScenarioResult.objects.count(), 1)
+        self.assertEqual(_count_rows(Scenario, ScenarioResult), (1, 1))
         scenario = Scenario.objects.get(pk=scenario_id)
         self.assertEqual(scenario.planning_area.pk, listed_planning_area["id"])
         self.assertEqual(
@@ -840,38 +1051,32 @@ class EndtoEndPlanningAreaAndScenarioTest(TransactionTestCase):
 
         # check that scenario metadata shows up in the plan details.
         response = self.client.get(
-            reverse("planning:get_planning_area_by_id"),
-            {"id": listed_planning_area["id"]},
-            content_type="application/json",
+            _URL_GET_PLANNING_AREA_BY_ID, {"id": listed_planning_area["id"]}
         )
         self.assertEqual(response.status_code, 200)
         planning_area = response.json()
-        self.assertEqual(planning_area["name"], "test plan")
-        self.assertEqual(planning_area["region_name"], "Sierra Nevada")
-        self.assertEqual(planning_area["id"], listed_planning_area["id"])
-        self.assertEqual(planning_area["geometry"], self.internal_geometry)
+        self.assertEqual(
+            {key: planning_area[key] for key in expected_planning_area},
+            expected_planning_area,
+        )
         self.assertEqual(planning_area["scenario_count"], 1)
         self.assertIsNotNone(planning_area["latest_updated"])
 
         # remove it
         response = self.client.post(
-            reverse("planning:delete_planning_area"),
+            _URL_DELETE_PLANNING_AREA,
             {"id": planning_area["id"]},
             content_type="application/json",
         )
         self.assertEqual(response.status_code, 200)
 
         # there should be no more planning areas
-        response = self.client.get(
-            reverse("planning:list_planning_areas"), {}, content_type="application/json"
-        )
+        response = self.client.get(_URL_LIST_PLANNING_AREAS, {})
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.json()), 0)
 
         # checking for a blank database
-        self.assertEqual(PlanningArea.objects.count(), 0)
-        self.assertEqual(Scenario.objects.count(), 0)
-        self.assertEqual(ScenarioResult.objects.count(), 0)
+        self.assertEqual(_count_rows(PlanningArea, Scenario, ScenarioResult), (0, 0, 0))
 
 
 #### SCENARIO Tests ####
@@ -891,38 +1096,52 @@ def _create_scenario(
         configuration=configuration,
         notes=notes,
     )
-    scenario.save()
+    ScenarioResult.objects.create(scenario=scenario)
+    return scenario
 
-    scenario_result = ScenarioResult.objects.create(scenario=scenario)
-    scenario_result.save()
 
-    return scenario
+# Bulk version of _create_scenario: creates the scenarios, and then their
+# default scenario results, with one INSERT each.
+def _create_scenarios(
+    planning_areas_and_names: list[tuple[PlanningArea, str]],
+    configuration: str,
+    notes: str | None = None,
+) -> list[Scenario]:
+    scenarios = Scenario.objects.bulk_create(
+        [
+            Scenario(
+                planning_area_id=planning_area.pk,
+                name=scenario_name,
+                configuration=configuration,
+                notes=notes,
+            )
+            for planning_area, scenario_name in planning_areas_and_names
+        ]
+    )
+    ScenarioResult.objects.bulk_create(
+        [ScenarioResult(scenario_id=scenario.pk) for scenario in scenarios]
+    )
+    return scenarios
 
 
 # TODO: add more tests when we start parsing configurations.
-class CreateScenarioTest(TransactionTestCase):
-    def setUp(self):
-        self.user = User.objects.create(username="testuser")
-        self.user.set_password("12345")
-        self.user.save()
+@override_settings(USE_CELERY_FOR_FORSYS=False)
+class CreateScenarioTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username="testuser")
+        cls.session_key = _create_session(cls.user)
 
-        self.geometry = {
-            "type": "MultiPolygon",
-            "coordinates": [[[[1, 2], [2, 3], [3, 4], [1, 2]]]],
-        }
-        self.stored_geometry = GEOSGeometry(json.dumps(self.geometry))
-        self.planning_area = _create_planning_area(
-            self.user, "test plan", self.stored_geometry
+        cls.planning_area = _create_planning_area(
+            cls.user, "test plan", _STORED_GEOMETRY
         )
 
-        self.user2 = User.objects.create(username="testuser2")
-        self.user2.set_password("12345")
-        self.user2.save()
-        self.planning_area2 = _create_planning_area(
-            self.user2, "test plan 2", self.stored_geometry
+        cls.user2 = User.objects.create(username="testuser2")
+        cls.planning_area2 = _create_planning_area(
+            cls.user2, "test plan 2", _STORED_GEOMETRY
         )
 
-        self.configuration = {
+        cls.configuration = {
             "question_id": 1,
             "weights": [],
             "est_cost": 2000,
@@ -937,15 +1156,23 @@ class CreateScenarioTest(TransactionTestCase):
             "scenario_output_fields": ["out1"],
             "max_treatment_area_ratio": 40000,
         }
+        # The request body most tests here post, encoded once.
+        cls.scenario_body = json.dumps(
+            {
+                "planning_area": cls.planning_area.pk,
+                "configuration": cls.configuration,
+                "name": "test scenario",
+            }
+        ).encode()
 
     @mock.patch(
         "planning.views.validate_scenario_treatment_ratio",
         return_value=(True, "all good"),
     )
     def test_create_scenario(self, validation):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:create_scenario"),
+            _URL_CREATE_SCENARIO,
             {
                 "planning_area": self.planning_area.pk,
                 "configuration": self.configuration,
@@ -957,34 +1184,48 @@ class CreateScenarioTest(TransactionTestCase):
         self.assertEqual(response.status_code, 200)
         output = response.json()
         scenario_id = output["id"]
-        self.assertEqual(Scenario.objects.count(), 1)
-        self.assertEqual(ScenarioResult.objects.count(), 1)
+        self.assertEqual(_count_rows(Scenario, ScenarioResult), (1, 1))
         scenario = Scenario.objects.get(pk=scenario_id)
         self.assertEqual(scenario.planning_area.pk, self.planning_area.pk)
         self.assertEqual(scenario.configuration, self.configuration)
         self.assertEqual(scenario.name, "test scenario")
         self.assertEqual(scenario.notes, "test notes")
 
+    @override_settings(USE_CELERY_FOR_FORSYS=True)
+    @mock.patch("planning.views.async_forsys_run.delay")
+    @mock.patch(
+        "planning.views.validate_scenario_treatment_ratio",
+        return_value=(True, "all good"),
+    )
+    def test_create_scenario_queues_run_on_commit(self, validation, delay):
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.client.post(
+                _URL_CREATE_SCENARIO,
+                self.scenario_body,
+                content_type="application/json",
+            )
+            delay.assert_not_called()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(callbacks), 1)
+        callbacks[0]()
+        delay.assert_called_once_with(response.json()["id"])
+
     @mock.patch(
         "planning.views.validate_scenario_treatment_ratio",
         return_value=(True, "all good"),
     )
     def test_create_scenario_no_notes(self, validation):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:create_scenario"),
-            {
-                "planning_area": self.planning_area.pk,
-                "configuration": self.configuration,
-                "name": "test scenario",
-            },
+            _URL_CREATE_SCENARIO,
+            self.scenario_body,
             content_type="application/json",
         )
         self.assertEqual(response.status_code, 200)
         output = json.loads(response.content)
         scenario_id = output["id"]
-        self.assertEqual(Scenario.objects.count(), 1)
-        self.assertEqual(ScenarioResult.objects.count(), 1)
+        self.assertEqual(_count_rows(Scenario, ScenarioResult), (1, 1))
         scenario = Scenario.objects.get(pk=scenario_id)
         self.assertEqual(scenario.planning_area.pk, self.planning_area.pk)
         self.assertEqual(scenario.configuration, self.configuration)
@@ -992,9 +1233,9 @@ class CreateScenarioTest(TransactionTestCase):
         self.assertEqual(scenario.notes, None)
 
     def test_create_scenario_missing_planning_area(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:create_scenario"),
+            _URL_CREATE_SCENARIO,
             {"configuration": self.configuration, "name": "test scenario"},
             content_type="application/json",
         )
@@ -1002,9 +1243,9 @@ class CreateScenarioTest(TransactionTestCase):
         self.assertRegex(str(response.content), r"This field is required")
 
     def test_create_scenario_missing_configuration(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:create_scenario"),
+            _URL_CREATE_SCENARIO,
             {"planning_area": self.planning_area.pk, "name": "test scenario"},
             content_type="application/json",
         )
@@ -1012,9 +1253,9 @@ class CreateScenarioTest(TransactionTestCase):
         self.assertRegex(str(response.content), r"This field is required")
 
     def test_create_scenario_missing_name(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:create_scenario"),
+            _URL_CREATE_SCENARIO,
             {
                 "planning_area": self.planning_area.pk,
                 "configuration": self.configuration,
@@ -1025,25 +1266,17 @@ class CreateScenarioTest(TransactionTestCase):
         self.assertRegex(str(response.content), r"This field is required")
 
     def test_create_scenario_duplicate_name(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         first_response = self.client.post(
-            reverse("planning:create_scenario"),
-            {
-                "planning_area": self.planning_area.pk,
-                "configuration": self.configuration,
-                "name": "test scenario",
-            },
+            _URL_CREATE_SCENARIO,
+            self.scenario_body,
             content_type="application/json",
         )
         self.assertEqual(first_response.status_code, 200)
 
         second_response = self.client.post(
-            reverse("planning:create_scenario"),
-            {
-                "planning_area": self.planning_area.pk,
-                "configuration": self.configuration,
-                "name": "test scenario",
-            },
+            _URL_CREATE_SCENARIO,
+            self.scenario_body,
             content_type="application/json",
         )
         self.assertEqual(second_response.status_code, 400)
@@ -1053,23 +1286,19 @@ class CreateScenarioTest(TransactionTestCase):
 
     def test_create_scenario_not_logged_in(self):
         response = self.client.post(
-            reverse("planning:create_scenario"),
-            {
-                "planning_area": self.planning_area.pk,
-                "configuration": self.configuration,
-                "name": "test scenario",
-            },
+            _URL_CREATE_SCENARIO,
+            self.scenario_body,
             content_type="application/json",
         )
         self.assertEqual(response.status_code, 400)
         self.assertRegex(str(response.content), r"User must be logged in")
 
     def test_create_scenario_for_nonexistent_planning_area(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:create_scenario"),
+            _URL_CREATE_SCENARIO,
             {
-                "planning_area": 999999,
+                "planning_area": _NONEXISTENT_ID,
                 "configuration": self.configuration,
                 "name": "test scenario",
             },
@@ -1079,9 +1308,9 @@ class CreateScenarioTest(TransactionTestCase):
         self.assertRegex(str(response.content), r"does not exist")
 
     def test_create_scenario_wrong_planning_area_user(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:create_scenario"),
+            _URL_CREATE_SCENARIO,
             {
                 "planning_area": self.planning_area2.pk,
                 "configuration": self.configuration,
@@ -1093,45 +1322,38 @@ class CreateScenarioTest(TransactionTestCase):
         self.assertRegex(str(response.content), r"No PlanningArea matches")
 
 
-class UpdateScenarioTest(TransactionTestCase):
-    def setUp(self):
-        self.user = User.objects.create(username="testuser")
-        self.user.set_password("12345")
-        self.user.save()
-        self.geometry = {
-            "type": "MultiPolygon",
-            "coordinates": [[[[1, 2], [2, 3], [3, 4], [1, 2]]]],
-        }
-        self.storable_geometry = GEOSGeometry(json.dumps(self.geometry))
-        self.old_notes = "Truly, you have a dizzying intellect."
-        self.old_name = "Man in black"
-        self.planning_area = _create_planning_area(
-            self.user, "test plan", self.storable_geometry
+class UpdateScenarioTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username="testuser")
+        cls.session_key = _create_session(cls.user)
+        cls.old_notes = "Truly, you have a dizzying intellect."
+        cls.old_name = "Man in black"
+        cls.planning_area = _create_planning_area(
+            cls.user, "test plan", _STORED_GEOMETRY
         )
-        self.scenario = _create_scenario(
-            self.planning_area, self.old_name, "{}", self.old_notes
+        cls.scenario = _create_scenario(
+            cls.planning_area, cls.old_name, "{}", cls.old_notes
         )
 
-        self.user2 = User.objects.create(username="testuser2")
-        self.user2.set_password("12345")
-        self.user2.save()
-        self.planning_area2 = _create_planning_area(
-            self.user2, "test plan2", self.storable_geometry
+        cls.user2 = User.objects.create(username="testuser2")
+        cls.planning_area2 = _create_planning_area(
+            cls.user2, "test plan2", _STORED_GEOMETRY
         )
-        self.user2scenario = _create_scenario(
-            self.planning_area2, "test user2scenario", "{}"
+        cls.user2scenario = _create_scenario(
+            cls.planning_area2, "test user2scenario", "{}"
         )
 
-        self.assertEqual(Scenario.objects.count(), 2)
-        self.assertEqual(ScenarioResult.objects.count(), 2)
+        cls.new_notes = "Wait till I get going!"
+        cls.new_name = "Vizzini"
 
-        self.new_notes = "Wait till I get going!"
-        self.new_name = "Vizzini"
+    def test_fixture_row_counts(self):
+        self.assertEqual(_count_rows(Scenario, ScenarioResult), (2, 2))
 
     def test_update_notes_and_name(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:update_scenario"),
+            _URL_UPDATE_SCENARIO,
             {"id": self.scenario.pk, "name": self.new_name, "notes": self.new_notes},
             content_type="application/json",
         )
@@ -1144,9 +1366,9 @@ class UpdateScenarioTest(TransactionTestCase):
         self.assertEqual(scenario.notes, self.new_notes)
 
     def test_update_notes_only(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:update_scenario"),
+            _URL_UPDATE_SCENARIO,
             {"id": self.scenario.pk, "notes": self.new_notes},
             content_type="application/json",
         )
@@ -1158,10 +1380,32 @@ class UpdateScenarioTest(TransactionTestCase):
         self.assertEqual(scenario.name, self.old_name)
         self.assertEqual(scenario.notes, self.new_notes)
 
+    def test_update_writes_only_changed_fields(self):
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                _URL_UPDATE_SCENARIO,
+                {"id": self.scenario.pk, "notes": self.new_notes},
+                content_type="application/json",
+            )
+        self.assertEqual(response.status_code, 200)
+        updates = [
+            query["sql"]
+            for query in queries.captured_queries
+            if query["sql"].startswith("UPDATE")
+        ]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('"notes"', updates[0])
+        self.assertIn('"updated_at"', updates[0])
+        self.assertNotIn('"name"', updates[0])
+        self.assertNotIn('"configuration"', updates[0])
+        scenario = Scenario.objects.get(pk=self.scenario.pk)
+        self.assertGreater(scenario.updated_at, self.scenario.updated_at)
+
     def test_update_name_only(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:update_scenario"),
+            _URL_UPDATE_SCENARIO,
             {"id": self.scenario.pk, "name": self.new_name},
             content_type="application/json",
         )
@@ -1174,9 +1418,9 @@ class UpdateScenarioTest(TransactionTestCase):
         self.assertEqual(scenario.notes, self.old_notes)
 
     def test_update_clear_notes(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:update_scenario"),
+            _URL_UPDATE_SCENARIO,
             {"id": self.scenario.pk, "notes": None},
             content_type="application/json",
         )
@@ -1189,9 +1433,9 @@ class UpdateScenarioTest(TransactionTestCase):
         self.assertEqual(scenario.notes, None)
 
     def test_update_empty_string_notes(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:update_scenario"),
+            _URL_UPDATE_SCENARIO,
             {"id": self.scenario.pk, "notes": ""},
             content_type="application/json",
         )
@@ -1204,9 +1448,9 @@ class UpdateScenarioTest(TransactionTestCase):
         self.assertEqual(scenario.notes, "")
 
     def test_update_nothing_to_update(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:update_scenario"),
+            _URL_UPDATE_SCENARIO,
             {"id": self.scenario.pk},
             content_type="application/json",
         )
@@ -1220,7 +1464,7 @@ class UpdateScenarioTest(TransactionTestCase):
 
     def test_update_not_logged_in(self):
         response = self.client.post(
-            reverse("planning:update_scenario"),
+            _URL_UPDATE_SCENARIO,
             {"id": self.scenario.pk, "name": self.new_name, "notes": self.new_notes},
             content_type="application/json",
         )
@@ -1228,9 +1472,9 @@ class UpdateScenarioTest(TransactionTestCase):
         self.assertRegex(str(response.content), r"User must be logged in")
 
     def test_update_missing_id(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:update_scenario"),
+            _URL_UPDATE_SCENARIO,
             {"name": self.new_name, "notes": self.new_notes},
             content_type="application/json",
         )
@@ -1238,9 +1482,9 @@ class UpdateScenarioTest(TransactionTestCase):
         self.assertRegex(str(response.content), r"Scenario ID is required")
 
     def test_update_wrong_user(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:update_scenario"),
+            _URL_UPDATE_SCENARIO,
             {
                 "id": self.user2scenario.pk,
                 "name": self.new_name,
@@ -1252,9 +1496,9 @@ class UpdateScenarioTest(TransactionTestCase):
         self.assertRegex(str(response.content), r"does not exist")
 
     def test_update_blank_name(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:update_scenario"),
+            _URL_UPDATE_SCENARIO,
             {"id": self.scenario.pk, "name": None, "notes": self.new_notes},
             content_type="application/json",
         )
@@ -1262,9 +1506,9 @@ class UpdateScenarioTest(TransactionTestCase):
         self.assertRegex(str(response.content), r"name must be defined")
 
     def test_update_empty_string_name(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:update_scenario"),
+            _URL_UPDATE_SCENARIO,
             {"id": self.scenario.pk, "name": None, "notes": self.new_notes},
             content_type="application/json",
         )
@@ -1272,43 +1516,41 @@ class UpdateScenarioTest(TransactionTestCase):
         self.assertRegex(str(response.content), r"name must be defined")
 
 
-class UpdateScenarioResultTest(TransactionTestCase):
-    def setUp(self):
-        self.user = User.objects.create(username="testuser")
-        self.user.set_password("12345")
-        self.user.save()
-        self.geometry = {
-            "type": "MultiPolygon",
-            "coordinates": [[[[1, 2], [2, 3], [3, 4], [1, 2]]]],
-        }
-        self.storable_geometry = GEOSGeometry(json.dumps(self.geometry))
-        self.planning_area = _create_planning_area(
-            self.user, "test plan", self.storable_geometry
+class UpdateScenarioResultTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username="testuser")
+        cls.session_key = _create_session(cls.user)
+        cls.planning_area = _create_planning_area(
+            cls.user, "test plan", _STORED_GEOMETRY
+        )
+        cls.scenario, cls.scenario2, cls.scenario3 = _create_scenarios(
+            [
+                (cls.planning_area, "test scenario"),
+                (cls.planning_area, "test scenario2"),
+                (cls.planning_area, "test scenario3"),
+            ],
+            "{}",
         )
-        self.scenario = _create_scenario(self.planning_area, "test scenario", "{}")
-        self.scenario2 = _create_scenario(self.planning_area, "test scenario2", "{}")
-        self.scenario3 = _create_scenario(self.planning_area, "test scenario3", "{}")
-        self.empty_planning_area = _create_planning_area(
-            self.user, "empty test plan", self.storable_geometry
+        cls.empty_planning_area = _create_planning_area(
+            cls.user, "empty test plan", _STORED_GEOMETRY
         )
 
-        self.user2 = User.objects.create(username="testuser2")
-        self.user2.set_password("12345")
-        self.user2.save()
-        self.planning_area2 = _create_planning_area(
-            self.user2, "test plan2", self.storable_geometry
+        cls.user2 = User.objects.create(username="testuser2")
+        cls.planning_area2 = _create_planning_area(
+            cls.user2, "test plan2", _STORED_GEOMETRY
         )
-        self.user2scenario = _create_scenario(
-            self.planning_area2, "test user2scenario", "{}"
+        cls.user2scenario = _create_scenario(
+            cls.planning_area2, "test user2scenario", "{}"
         )
 
-        self.assertEqual(Scenario.objects.count(), 4)
-        self.assertEqual(ScenarioResult.objects.count(), 4)
+    def test_fixture_row_counts(self):
+        self.assertEqual(_count_rows(Scenario, ScenarioResult), (4, 4))
 
     def test_update_scenario_result(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:update_scenario_result"),
+            _URL_UPDATE_SCENARIO_RESULT,
             {
                 "scenario_id": self.scenario.pk,
                 "result": json.dumps({"result1": "test result"}),
@@ -1328,9 +1570,9 @@ class UpdateScenarioResultTest(TransactionTestCase):
         )
 
     def test_update_scenario_result_twice(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:update_scenario_result"),
+            _URL_UPDATE_SCENARIO_RESULT,
             {
                 "scenario_id": self.scenario.pk,
                 "result": json.dumps({"result1": "test result"}),
@@ -1342,7 +1584,7 @@ class UpdateScenarioResultTest(TransactionTestCase):
         self.assertEqual(response.status_code, 200)
 
         response = self.client.post(
-            reverse("planning:update_scenario_result"),
+            _URL_UPDATE_SCENARIO_RESULT,
             {
                 "scenario_id": self.scenario.pk,
                 "result": json.dumps(
@@ -1374,9 +1616,9 @@ class UpdateScenarioResultTest(TransactionTestCase):
         )
 
     def test_update_scenario_result_status_only(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:update_scenario_result"),
+            _URL_UPDATE_SCENARIO_RESULT,
             {"scenario_id": self.scenario.pk, "status": ScenarioResultStatus.RUNNING},
             content_type="application/json",
         )
@@ -1387,9 +1629,9 @@ class UpdateScenarioResultTest(TransactionTestCase):
         self.assertEqual(scenario_result.run_details, None)
 
     def test_update_scenario_result_result_only(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:update_scenario_result"),
+            _URL_UPDATE_SCENARIO_RESULT,
             {
                 "scenario_id": self.scenario.pk,
                 "result": json.dumps({"comment": "test comment"}),
@@ -1405,9 +1647,9 @@ class UpdateScenarioResultTest(TransactionTestCase):
         self.assertEqual(scenario_result.run_details, None)
 
     def test_update_scenario_result_run_details_only(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:update_scenario_result"),
+            _URL_UPDATE_SCENARIO_RESULT,
             {
                 "scenario_id": self.scenario.pk,
                 "run_details": json.dumps({"comment": "test comment"}),
@@ -1423,9 +1665,9 @@ class UpdateScenarioResultTest(TransactionTestCase):
         )
 
     def test_update_scenario_result_bad_status_pending_to_pending(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:update_scenario_result"),
+            _URL_UPDATE_SCENARIO_RESULT,
             {"scenario_id": self.scenario.pk, "status": ScenarioResultStatus.PENDING},
             content_type="application/json",
         )
@@ -1433,9 +1675,9 @@ class UpdateScenarioResultTest(TransactionTestCase):
         self.assertRegex(str(response.content), r"Invalid new state")
 
     def test_update_scenario_result_bad_status_pending_to_success(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:update_scenario_result"),
+            _URL_UPDATE_SCENARIO_RESULT,
             {"scenario_id": self.scenario.pk, "status": ScenarioResultStatus.SUCCESS},
             content_type="application/json",
         )
@@ -1446,7 +1688,7 @@ class UpdateScenarioResultTest(TransactionTestCase):
     # TODO: Update when we have EPs sending a credential over.
     def test_update_scenario_result_not_logged_in(self):
         response = self.client.post(
-            reverse("planning:update_scenario_result"),
+            _URL_UPDATE_SCENARIO_RESULT,
             {
                 "scenario_id": self.scenario.pk,
                 "result": json.dumps({"result1": "test result"}),
@@ -1466,9 +1708,9 @@ class UpdateScenarioResultTest(TransactionTestCase):
     # This works since EPs don't have a user context.
     # TODO: Update when we have EPs sending a credential over.
     def test_update_scenario_result_wrong_user(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:update_scenario_result"),
+            _URL_UPDATE_SCENARIO_RESULT,
             {
                 "scenario_id": self.user2scenario.pk,
                 "result": json.dumps({"result1": "test result"}),
@@ -1486,11 +1728,11 @@ class UpdateScenarioResultTest(TransactionTestCase):
         )
 
     def test_update_scenario_result_nonexistent_scenario(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:update_scenario_result"),
+            _URL_UPDATE_SCENARIO_RESULT,
             {
-                "scenario_id": 99999,
+                "scenario_id": _NONEXISTENT_ID,
                 "result": json.dumps({"result1": "test result"}),
                 "run_details": json.dumps({"details": "super duper details"}),
                 "status": ScenarioResultStatus.RUNNING,
@@ -1500,21 +1742,35 @@ class UpdateScenarioResultTest(TransactionTestCase):
         self.assertEqual(response.status_code, 400)
         self.assertRegex(str(response.content), r"does not exist")
 
+    def test_update_scenario_result_single_query(self):
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
+        with self.assertNumQueries(1):
+            response = self.client.post(
+                _URL_UPDATE_SCENARIO_RESULT,
+                {
+                    "scenario_id": self.scenario.pk,
+                    "run_details": json.dumps({"details": "super duper details"}),
+                    "status": ScenarioResultStatus.RUNNING,
+                },
+                content_type="application/json",
+            )
+        self.assertEqual(response.status_code, 200)
+        scenario_result = ScenarioResult.objects.get(scenario__id=self.scenario.pk)
+        self.assertEqual(scenario_result.status, ScenarioResultStatus.RUNNING)
+        self.assertEqual(
+            scenario_result.run_details, json.dumps({"details": "super duper details"})
+        )
 
-class ListScenariosForPlanningAreaTest(TransactionTestCase):
-    def setUp(self):
-        self.user = User.objects.create(username="testuser")
-        self.user.set_password("12345")
-        self.user.save()
-        self.geometry = {
-            "type": "MultiPolygon",
-            "coordinates": [[[[1, 2], [2, 3], [3, 4], [1, 2]]]],
-        }
-        self.storable_geometry = GEOSGeometry(json.dumps(self.geometry))
-        self.planning_area = _create_planning_area(
-            self.user, "test plan", self.storable_geometry
+
+class ListScenariosForPlanningAreaTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username="testuser")
+        cls.session_key = _create_session(cls.user)
+        cls.planning_area = _create_planning_area(
+            cls.user, "test plan", _STORED_GEOMETRY
         )
-        self.configuration = {
+        cls.configuration = {
             "question_id": 1,
             "weights": [],
             "est_cost": 2000,
@@ -1529,38 +1785,34 @@ class ListScenariosForPlanningAreaTest(TransactionTestCase):
             "scenario_output_fields": ["out1"],
             "max_treatment_area_ratio": 40000,
         }
-        self.scenario = _create_scenario(
-            self.planning_area, "test scenario", self.configuration
-        )
-        self.scenario2 = _create_scenario(
-            self.planning_area, "test scenario2", self.configuration
-        )
-        self.scenario3 = _create_scenario(
-            self.planning_area, "test scenario3", self.configuration
+        cls.scenario, cls.scenario2, cls.scenario3 = _create_scenarios(
+            [
+                (cls.planning_area, "test scenario"),
+                (cls.planning_area, "test scenario2"),
+                (cls.planning_area, "test scenario3"),
+            ],
+            cls.configuration,
         )
-        self.empty_planning_area = _create_planning_area(
-            self.user, "empty test plan", self.storable_geometry
+        cls.empty_planning_area = _create_planning_area(
+            cls.user, "empty test plan", _STORED_GEOMETRY
         )
 
-        self.user2 = User.objects.create(username="testuser2")
-        self.user2.set_password("12345")
-        self.user2.save()
-        self.planning_area2 = _create_planning_area(
-            self.user2, "test plan2", self.storable_geometry
+        cls.user2 = User.objects.create(username="testuser2")
+        cls.planning_area2 = _create_planning_area(
+            cls.user2, "test plan2", _STORED_GEOMETRY
         )
-        self.user2scenario = _create_scenario(
-            self.planning_area2, "test user2scenario", "{}"
+        cls.user2scenario = _create_scenario(
+            cls.planning_area2, "test user2scenario", "{}"
         )
 
-        self.assertEqual(Scenario.objects.count(), 4)
-        self.assertEqual(ScenarioResult.objects.count(), 4)
+    def test_fixture_row_counts(self):
+        self.assertEqual(_count_rows(Scenario, ScenarioResult), (4, 4))
 
     def test_list_scenario(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.get(
-            reverse("planning:list_scenarios_for_planning_area"),
+            _URL_LIST_SCENARIOS_FOR_PLANNING_AREA,
             {"planning_area": self.planning_area.pk},
-            content_type="application/json",
         )
         self.assertEqual(response.status_code, 200)
         scenarios = response.json()
@@ -1568,59 +1820,93 @@ class ListScenariosForPlanningAreaTest(TransactionTestCase):
         self.assertIsNotNone(scenarios[0]["created_at"])
         self.assertIsNotNone(scenarios[0]["updated_at"])
 
+    def test_list_scenario_matches_get_scenario(self):
+        # Also cover a scenario with no ScenarioResult.
+        Scenario.objects.create(
+            planning_area=self.planning_area,
+            name="test scenario without result",
+            configuration=self.configuration,
+        )
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
+        response = self.client.get(
+            _URL_LIST_SCENARIOS_FOR_PLANNING_AREA,
+            {"planning_area": self.planning_area.pk},
+        )
+        self.assertEqual(response.status_code, 200)
+        listed_scenarios = response.json()
+        self.assertEqual(len(listed_scenarios), 4)
+        for listed_scenario in listed_scenarios:
+            with self.subTest(listed_scenario["name"]):
+                response = self.client.get(
+                    _URL_GET_SCENARIO_BY_ID, {"id": listed_scenario["id"]}
+                )
+                self.assertEqual(listed_scenario, response.json())
+
     def test_list_scenario_not_logged_in(self):
         response = self.client.get(
-            reverse("planning:list_scenarios_for_planning_area"),
+            _URL_LIST_SCENARIOS_FOR_PLANNING_AREA,
             {"planning_area": self.planning_area.pk},
-            content_type="application/json",
         )
         self.assertEqual(response.status_code, 400)
         self.assertRegex(str(response.content), r"User must be logged in")
 
     def test_list_scenario_wrong_user(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.get(
-            reverse("planning:list_scenarios_for_planning_area"),
+            _URL_LIST_SCENARIOS_FOR_PLANNING_AREA,
             {"planning_area": self.planning_area2.pk},
-            content_type="application/json",
         )
         self.assertEqual(response.status_code, 200)
         scenarios = response.json()
         self.assertEqual(len(scenarios), 0)
 
     def test_list_scenario_empty_planning_area(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.get(
-            reverse("planning:list_scenarios_for_planning_area"),
+            _URL_LIST_SCENARIOS_FOR_PLANNING_AREA,
             {"planning_area": self.empty_planning_area.pk},
-            content_type="application/json",
         )
         self.assertEqual(response.status_code, 200)
         scenarios = response.json()
         self.assertEqual(len(scenarios), 0)
 
+    def test_list_scenarios_query_count(self):
+        # Scenario results are fetched along with the scenarios, so listing three
+        # scenarios takes as many queries as listing none.
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
+        # The first request after logging in also does session bookkeeping.
+        self.client.get(
+            _URL_LIST_SCENARIOS_FOR_PLANNING_AREA,
+            {"planning_area": self.empty_planning_area.pk},
+        )
+        with CaptureQueriesContext(connection) as empty_list_queries:
+            self.client.get(
+                _URL_LIST_SCENARIOS_FOR_PLANNING_AREA,
+                {"planning_area": self.empty_planning_area.pk},
+            )
+        with self.assertNumQueries(len(empty_list_queries)):
+            response = self.client.get(
+                _URL_LIST_SCENARIOS_FOR_PLANNING_AREA,
+                {"planning_area": self.planning_area.pk},
+            )
+        self.assertEqual(len(response.json()), 3)
+
     def test_list_scenario_nonexistent_planning_area(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.get(
-            reverse("planning:list_scenarios_for_planning_area"),
-            {"planning_area": 99999},
-            content_type="application/json",
+            _URL_LIST_SCENARIOS_FOR_PLANNING_AREA, {"planning_area": _NONEXISTENT_ID}
         )
         self.assertEqual(response.status_code, 200)
         scenarios = response.json()
         self.assertEqual(len(scenarios), 0)
 
 
-class GetScenarioTest(TransactionTestCase):
-    def setUp(self):
-        self.user = User.objects.create(username="testuser")
-        self.user.set_password("12345")
-        self.user.save()
-        self.geometry = {
-            "type": "MultiPolygon",
-            "coordinates": [[[[1, 2], [2, 3], [3, 4], [1, 2]]]],
-        }
-        self.configuration = {
+class GetScenarioTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username="testuser")
+        cls.session_key = _create_session(cls.user)
+        cls.configuration = {
             "question_id": 1,
             "weights": [],
             "est_cost": 2000,
@@ -1635,74 +1921,76 @@ class GetScenarioTest(TransactionTestCase):
             "scenario_output_fields": ["out1"],
             "max_treatment_area_ratio": 40000,
         }
-        self.storable_geometry = GEOSGeometry(json.dumps(self.geometry))
-        self.planning_area = _create_planning_area(
-            self.user, "test plan", self.storable_geometry
+        cls.planning_area = _create_planning_area(
+            cls.user, "test plan", _STORED_GEOMETRY
         )
-        self.scenario = _create_scenario(
-            self.planning_area, "test scenario", self.configuration
+        cls.scenario = _create_scenario(
+            cls.planning_area, "test scenario", cls.configuration
         )
 
-        self.user2 = User.objects.create(username="testuser2")
-        self.user2.set_password("12345")
-        self.user2.save()
-        self.planning_area2 = _create_planning_area(
-            self.user2, "test plan2", self.storable_geometry
+        cls.user2 = User.objects.create(username="testuser2")
+        cls.planning_area2 = _create_planning_area(
+            cls.user2, "test plan2", _STORED_GEOMETRY
         )
-        self.scenario2 = _create_scenario(
-            self.planning_area2, "test scenario2", self.configuration
+        cls.scenario2 = _create_scenario(
+            cls.planning_area2, "test scenario2", cls.configuration
         )
 
-        self.assertEqual(Scenario.objects.count(), 2)
-        self.assertEqual(ScenarioResult.objects.count(), 2)
+    def test_fixture_row_counts(self):
+        self.assertEqual(_count_rows(Scenario, ScenarioResult), (2, 2))
 
     def test_get_scenario(self):
-        self.client.force_login(self.user)
-        response = self.client.get(
-            reverse("planning:get_scenario_by_id"),
-            {"id": self.scenario.pk},
-            content_type="application/json",
-        )
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
+        response = self.client.get(_URL_GET_SCENARIO_BY_ID, {"id": self.scenario.pk})
         self.assertEqual(response.status_code, 200)
         response_json = response.json()
         self.assertIsNotNone(response_json["created_at"])
         self.assertIsNotNone(response_json["updated_at"])
 
-    def test_get_scenario_not_logged_in(self):
+    def test_get_scenario_not_modified(self):
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
+        response = self.client.get(_URL_GET_SCENARIO_BY_ID, {"id": self.scenario.pk})
+        self.assertEqual(response.status_code, 200)
+        etag = response.headers["ETag"]
+
         response = self.client.get(
-            reverse("planning:get_scenario_by_id"),
-            {"id": self.scenario.pk},
-            content_type="application/json",
+            _URL_GET_SCENARIO_BY_ID, {"id": self.scenario.pk}, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+        # The scenario result is part of the response, so its changes count too.
+        self.scenario.results.status = ScenarioResultStatus.RUNNING
+        self.scenario.results.save()
+        response = self.client.get(
+            _URL_GET_SCENARIO_BY_ID, {"id": self.scenario.pk}, HTTP_IF_NONE_MATCH=etag
         )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json()["scenario_result"]["status"], ScenarioResultStatus.RUNNING
+        )
+
+    def test_get_scenario_not_logged_in(self):
+        response = self.client.get(_URL_GET_SCENARIO_BY_ID, {"id": self.scenario.pk})
         self.assertEqual(response.status_code, 400)
         self.assertRegex(str(response.content), r"User must be logged in")
 
     def test_get_scenario_wrong_user(self):
-        self.client.force_login(self.user)
-        response = self.client.get(
-            reverse("planning:get_scenario_by_id"),
-            {"id": self.scenario2.pk},
-            content_type="application/json",
-        )
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
+        response = self.client.get(_URL_GET_SCENARIO_BY_ID, {"id": self.scenario2.pk})
         self.assertEqual(response.status_code, 400)
         self.assertRegex(str(response.content), r"does not exist")
 
     def test_get_scenario_nonexistent_scenario(self):
-        self.client.force_login(self.user)
-        response = self.client.get(
-            reverse("planning:get_scenario_by_id"),
-            {"id": 99999},
-            content_type="application/json",
-        )
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
+        response = self.client.get(_URL_GET_SCENARIO_BY_ID, {"id": _NONEXISTENT_ID})
         self.assertEqual(response.status_code, 400)
         self.assertRegex(str(response.content), r"does not exist")
 
     def test_get_scenario_with_results(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.get(
-            reverse("planning:get_scenario_by_id"),
-            {"id": self.scenario.pk, "show_results": True},
-            content_type="application/json",
+            _URL_GET_SCENARIO_BY_ID, {"id": self.scenario.pk, "show_results": True}
         )
         self.assertEqual(response.status_code, 200)
         result = response.json()
@@ -1712,245 +2000,247 @@ class GetScenarioTest(TransactionTestCase):
         )
 
 
-class GetScenarioDownloadTest(TransactionTestCase):
-    def setUp(self):
-        super().setUp()
-        self.set_verbose = True
-        self.user = User.objects.create(username="testuser")
-        self.user.set_password("12345")
-        self.user.save()
-        self.geometry = {
-            "type": "MultiPolygon",
-            "coordinates": [[[[1, 2], [2, 3], [3, 4], [1, 2]]]],
-        }
-        self.storable_geometry = GEOSGeometry(json.dumps(self.geometry))
-        self.planning_area = _create_planning_area(
-            self.user, "test plan", self.storable_geometry
+class GetScenarioDownloadTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username="testuser")
+        cls.session_key = _create_session(cls.user)
+        cls.planning_area = _create_planning_area(
+            cls.user, "test plan", _STORED_GEOMETRY
         )
-        self.scenario = _create_scenario(self.planning_area, "test scenario", "{}")
+        cls.scenario = _create_scenario(cls.planning_area, "test scenario", "{}")
 
         # set scenario result status to success
-        self.scenario_result = ScenarioResult.objects.get(scenario__id=self.scenario.pk)
-        self.scenario_result.status = ScenarioResultStatus.SUCCESS
-        self.scenario_result.save()
+        cls.scenario_result = ScenarioResult.objects.get(scenario__id=cls.scenario.pk)
+        cls.scenario_result.status = ScenarioResultStatus.SUCCESS
+        cls.scenario_result.save()
+
+        # create a second scenario with a different user
+
+        cls.user2 = User.objects.create(username="testuser2")
+        cls.user2_session_key = _create_session(cls.user2)
+        cls.planning_area2 = _create_planning_area(
+            cls.user2, "test plan2", _STORED_GEOMETRY
+        )
+        cls.scenario2 = _create_scenario(cls.planning_area2, "test scenario2", "{}")
+        # set scenario result status to success
+        cls.scenario2_result = ScenarioResult.objects.get(scenario__id=cls.scenario2.pk)
+        cls.scenario2_result.status = ScenarioResultStatus.SUCCESS
+        cls.scenario2_result.save()
+
+    def setUp(self):
+        super().setUp()
+
+        # Point OUTPUT_DIR at a scratch directory for just this test, rather than
+        # writing into (and cleaning up after ourselves in) the real one.
+        output_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, output_dir)
+        output_dir_override = override_settings(OUTPUT_DIR=Path(output_dir))
+        output_dir_override.enable()
+        self.addCleanup(output_dir_override.disable)
 
         # generate fake data in a directory that corresponds to this scenario name
         self.mock_project_path = (
             str(settings.OUTPUT_DIR) + "/" + str(self.scenario.uuid)
         )
-
-        # this will also make the output directory that we currently don't commit
-        os.makedirs(self.mock_project_path, exist_ok=True)
+        os.makedirs(self.mock_project_path)
         self.mock_project_file = os.path.join(self.mock_project_path, "fake_data.txt")
         with open(self.mock_project_file, "w") as handle:
             print("Just test data", file=handle)
 
-        # create a second scenario with a different user
-
-        self.user2 = User.objects.create(username="testuser2")
-        self.user2.set_password("12345")
-        self.user2.save()
-        self.planning_area2 = _create_planning_area(
-            self.user2, "test plan2", self.storable_geometry
-        )
-        self.scenario2 = _create_scenario(self.planning_area2, "test scenario2", "{}")
-        # set scenario result status to success
-        self.scenario2_result = ScenarioResult.objects.get(
-            scenario__id=self.scenario2.pk
-        )
-        self.scenario2_result.status = ScenarioResultStatus.SUCCESS
-        self.scenario2_result.save()
-
-        self.assertEqual(Scenario.objects.count(), 2)
-        self.assertEqual(ScenarioResult.objects.count(), 2)
-
-    def tearDown(self):
-        os.remove(self.mock_project_file)
-        os.rmdir(self.mock_project_path)
-        return super().tearDown()
+    def test_fixture_row_counts(self):
+        self.assertEqual(_count_rows(Scenario, ScenarioResult), (2, 2))
 
     def test_get_scenario_with_zip(self):
-        self.client.force_login(self.user)
-        response = self.client.get(
-            reverse("planning:download_csv"), {"id": self.scenario.pk}
-        )
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
+        response = self.client.get(_URL_DOWNLOAD_CSV, {"id": self.scenario.pk})
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.headers["Content-Type"], "application/zip")
-        self.assertIsInstance(response.content, bytes)
+        self.assertTrue(response.streaming)
+        with zipfile.ZipFile(io.BytesIO(b"".join(response.streaming_content))) as zipf:
+            self.assertEqual(
+                zipf.namelist(), [str(self.scenario.uuid) + "/fake_data.txt"]
+            )
+
+    def test_get_scenario_with_zip_skips_result(self):
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(_URL_DOWNLOAD_CSV, {"id": self.scenario.pk})
+        self.assertEqual(response.status_code, 200)
+        for query in queries:
+            self.assertNotIn("planning_scenarioresult", query["sql"])
+            self.assertNotIn('"geometry"', query["sql"])
 
     def test_get_scenario_not_logged_in(self):
-        response = self.client.get(
-            reverse("planning:download_csv"),
-            {"id": self.scenario.pk},
-            content_type="application/json",
-        )
+        response = self.client.get(_URL_DOWNLOAD_CSV, {"id": self.scenario.pk})
         self.assertEqual(response.status_code, 401)
         self.assertRegex(str(response.content), r"Unauthorized. User is not logged in.")
 
     def test_get_scenario_wrong_user(self):
-        self.client.force_login(self.user)
-        response = self.client.get(
-            reverse("planning:download_csv"),
-            {"id": self.scenario2.pk},
-            content_type="application/json",
-        )
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
+        response = self.client.get(_URL_DOWNLOAD_CSV, {"id": self.scenario2.pk})
         self.assertEqual(response.status_code, 404)
         self.assertRegex(str(response.content), r"does not exist")
 
     def test_get_scenario_without_project_data(self):
-        self.client.force_login(self.user2)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.user2_session_key
         self.scenario2_result.status = ScenarioResultStatus.SUCCESS
         self.scenario2_result.save()
 
-        self.client.force_login(self.user2)
-        response = self.client.get(
-            reverse("planning:download_csv"),
-            {"id": self.scenario2.pk},
-            content_type="application/json",
-        )
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.user2_session_key
+        response = self.client.get(_URL_DOWNLOAD_CSV, {"id": self.scenario2.pk})
         self.assertEqual(response.status_code, 400)
         self.assertRegex(str(response.content), r"Scenario files cannot be read")
 
     def test_get_scenario_without_success_status_still_returns_data(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         self.scenario_result.status = ScenarioResultStatus.FAILURE
         self.scenario_result.save()
 
-        response = self.client.get(
-            reverse("planning:download_csv"),
-            {"id": self.scenario.pk},
-            content_type="application/json",
-        )
+        response = self.client.get(_URL_DOWNLOAD_CSV, {"id": self.scenario.pk})
         self.assertEqual(response.status_code, 200)
 
     def test_get_scenario_nonexistent_scenario(self):
-        self.client.force_login(self.user)
-        response = self.client.get(
-            reverse("planning:download_csv"),
-            {"id": 99999},
-            content_type="application/json",
-        )
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
+        response = self.client.get(_URL_DOWNLOAD_CSV, {"id": _NONEXISTENT_ID})
         self.assertEqual(response.status_code, 404)
         self.assertRegex(str(response.content), r"does not exist")
 
 
-class DeleteScenarioTest(TransactionTestCase):
-    def setUp(self):
-        self.user = User.objects.create(username="testuser")
-        self.user.set_password("12345")
-        self.user.save()
-        self.geometry = {
-            "type": "MultiPolygon",
-            "coordinates": [[[[1, 2], [2, 3], [3, 4], [1, 2]]]],
-        }
-        self.storable_geometry = GEOSGeometry(json.dumps(self.geometry))
-        self.planning_area = _create_planning_area(
-            self.user, "test plan", self.storable_geometry
+class DeleteScenarioTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username="testuser")
+        cls.session_key = _create_session(cls.user)
+        cls.planning_area = _create_planning_area(
+            cls.user, "test plan", _STORED_GEOMETRY
+        )
+        cls.scenario, cls.scenario2, cls.scenario3 = _create_scenarios(
+            [
+                (cls.planning_area, "test scenario"),
+                (cls.planning_area, "test scenario2"),
+                (cls.planning_area, "test scenario3"),
+            ],
+            "{}",
         )
-        self.scenario = _create_scenario(self.planning_area, "test scenario", "{}")
-        self.scenario2 = _create_scenario(self.planning_area, "test scenario2", "{}")
-        self.scenario3 = _create_scenario(self.planning_area, "test scenario3", "{}")
 
-        self.user2 = User.objects.create(username="testuser2")
-        self.user2.set_password("12345")
-        self.user2.save()
-        self.planning_area2 = _create_planning_area(
-            self.user2, "test plan2", self.storable_geometry
+        cls.user2 = User.objects.create(username="testuser2")
+        cls.planning_area2 = _create_planning_area(
+            cls.user2, "test plan2", _STORED_GEOMETRY
         )
-        self.user2scenario = _create_scenario(
-            self.planning_area2, "test user2scenario", "{}"
+        cls.user2scenario = _create_scenario(
+            cls.planning_area2, "test user2scenario", "{}"
         )
 
-        self.assertEqual(Scenario.objects.count(), 4)
-        self.assertEqual(ScenarioResult.objects.count(), 4)
+    def test_fixture_row_counts(self):
+        self.assertEqual(_count_rows(Scenario, ScenarioResult), (4, 4))
 
     def test_delete_scenario(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:delete_scenario"),
+            _URL_DELETE_SCENARIO,
             {"scenario_id": self.scenario.pk},
             content_type="application/json",
         )
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(Scenario.objects.count(), 3)
-        self.assertEqual(ScenarioResult.objects.count(), 3)
+        self.assertEqual(_count_rows(Scenario, ScenarioResult), (3, 3))
+
+    def test_delete_scenario_does_not_fetch_configuration(self):
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(
+                _URL_DELETE_SCENARIO,
+                {"scenario_id": [self.scenario.pk, self.scenario2.pk]},
+                content_type="application/json",
+            )
+        self.assertEqual(response.status_code, 200)
+        for query in queries.captured_queries:
+            self.assertNotIn('"configuration"', query["sql"])
+        self.assertEqual(_count_rows(Scenario, ScenarioResult), (2, 2))
 
     def test_delete_scenario_multiple_owned(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         scenario_ids = [self.scenario.pk, self.scenario2.pk]
         response = self.client.post(
-            reverse("planning:delete_scenario"),
+            _URL_DELETE_SCENARIO,
             {"scenario_id": scenario_ids},
             content_type="application/json",
         )
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(Scenario.objects.count(), 2)
-        self.assertEqual(ScenarioResult.objects.count(), 2)
+        self.assertEqual(_count_rows(Scenario, ScenarioResult), (2, 2))
 
     # Silently does nothing for the non-owned scenario.
     def test_delete_scenario_multiple_partially_owned(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         scenario_ids = [self.scenario.pk, self.scenario2.pk, self.user2scenario.pk]
         response = self.client.post(
-            reverse("planning:delete_scenario"),
+            _URL_DELETE_SCENARIO,
             {"scenario_id": scenario_ids},
             content_type="application/json",
         )
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(Scenario.objects.count(), 2)
-        self.assertEqual(ScenarioResult.objects.count(), 2)
+        self.assertEqual(_count_rows(Scenario, ScenarioResult), (2, 2))
 
     def test_delete_scenario_not_logged_in(self):
         response = self.client.post(
-            reverse("planning:delete_scenario"),
+            _URL_DELETE_SCENARIO,
             {"scenario_id": self.scenario.pk},
             content_type="application/json",
         )
         self.assertEqual(response.status_code, 400)
-        self.assertEqual(Scenario.objects.count(), 4)
-        self.assertEqual(ScenarioResult.objects.count(), 4)
+        self.assertEqual(_count_rows(Scenario, ScenarioResult), (4, 4))
         self.assertRegex(str(response.content), r"User must be logged in")
 
     # Silently does nothing.
     def test_delete_scenario_wrong_user(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:delete_scenario"),
+            _URL_DELETE_SCENARIO,
             {"scenario_id": self.user2scenario.pk},
             content_type="application/json",
         )
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(Scenario.objects.count(), 4)
-        self.assertEqual(ScenarioResult.objects.count(), 4)
+        self.assertEqual(_count_rows(Scenario, ScenarioResult), (4, 4))
 
     # Silently does nothing.
     def test_delete_scenario_nonexistent_id(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:delete_scenario"),
-            {"scenario_id": 99999},
+            _URL_DELETE_SCENARIO,
+            {"scenario_id": _NONEXISTENT_ID},
             content_type="application/json",
         )
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(Scenario.objects.count(), 4)
-        self.assertEqual(ScenarioResult.objects.count(), 4)
+        self.assertEqual(_count_rows(Scenario, ScenarioResult), (4, 4))
 
     def test_delete_scenario_missing_id(self):
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         response = self.client.post(
-            reverse("planning:delete_scenario"), {}, content_type="application/json"
+            _URL_DELETE_SCENARIO, {}, content_type="application/json"
         )
         self.assertEqual(response.status_code, 400)
-        self.assertEqual(Scenario.objects.count(), 4)
-        self.assertEqual(ScenarioResult.objects.count(), 4)
+        self.assertEqual(_count_rows(Scenario, ScenarioResult), (4, 4))
         self.assertRegex(str(response.content), r"Must specify scenario id")
 
+    def test_delete_scenario_bad_id_type(self):
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
+        response = self.client.post(
+            _URL_DELETE_SCENARIO,
+            {"scenario_id": str(self.scenario.pk)},
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(_count_rows(Scenario, ScenarioResult), (4, 4))
+        self.assertRegex(
+            str(response.content), r"scenario_id must be an int or a list of ints"
+        )
 
-class CreateSharedLinkTest(TransactionTestCase):
-    def setUp(self):
-        self.user = User.objects.create(username="testuser")
-        self.user.set_password("12345")
-        self.user.save()
+
+class CreateSharedLinkTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(username="testuser")
+        cls.session_key = _create_session(cls.user)
 
     def test_create_shared_link(self):
         view_state = {
@@ -1965,10 +2255,10 @@ class CreateSharedLinkTest(TransactionTestCase):
             "zoom": "+500",
         }
         view_json = json.dumps(view_state)
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         # generate the new link with a 'view-state'
         response = self.client.post(
-            reverse("planning:create_shared_link"),
+            _URL_CREATE_SHARED_LINK,
             {"view_state": view_json},
             content_type="application/json",
         )
@@ -1991,10 +2281,10 @@ class CreateSharedLinkTest(TransactionTestCase):
             "zoom": "+500",
         }
         view_json = json.dumps(view_state)
-        self.client.force_login(self.user)
+        self.client.cookies[settings.SESSION_COOKIE_NAME] = self.session_key
         # generate the new link with a 'view-state'
         response = self.client.post(
-            reverse("planning:create_shared_link"),
+            _URL_CREATE_SHARED_LINK,
             {"view_state": view_json},
             content_type="application/json",
         )
@@ -2002,8 +2292,7 @@ class CreateSharedLinkTest(TransactionTestCase):
         json_response = json.loads(response.content)
         link_code = json_response["link_code"]
         shared_link_response = self.client.get(
-            reverse("planning:get_shared_link", kwargs={"link_code": link_code}),
-            content_type="application/json",
+            reverse("planning:get_shared_link", kwargs={"link_code": link_code})
         )
         json_get_response = json.loads(shared_link_response.content)
         self.assertJSONEqual(json_get_response["view_state"], view_state)
@@ -2011,7 +2300,27 @@ class CreateSharedLinkTest(TransactionTestCase):
     def test_retrieving_bad_link(self):
         # then fetch the data with a bad link code
         shared_link_response = self.client.get(
-            reverse("planning:get_shared_link", kwargs={"link_code": "madeuplink"}),
-            content_type="application/json",
+            reverse("planning:get_shared_link", kwargs={"link_code": "madeuplink"})
         )
         self.assertEqual(shared_link_response.status_code, 404)
+
+
+#### TREATMENT GOALS Tests ####
+
+
+class TreatmentGoalsConfigTest(TestCase):
+    def test_get_treatment_goals(self):
+        response = self.client.get(
+            _URL_TREATMENT_GOALS_CONFIG, {"region_name": "sierra-nevada"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.json(), get_treatment_goals_by_region_name()["sierra-nevada"]
+        )
+
+    def test_get_treatment_goals_unknown_region(self):
+        response = self.client.get(
+            _URL_TREATMENT_GOALS_CONFIG, {"region_name": "north-pole"}
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.json())
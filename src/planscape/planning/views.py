@@ -1,13 +1,18 @@
+import hashlib
 import json
 import os
+from datetime import datetime
+from functools import lru_cache
 
 
 from base.region_name import display_name_to_region, region_to_display_name
 from django.conf import settings
 from django.contrib.auth.models import User
-from django.contrib.gis.geos import GEOSGeometry
+from django.contrib.gis.db.models.functions import AsGeoJSON
+from django.contrib.gis.geos import MultiPolygon, Polygon
 from django.contrib.sites.shortcuts import get_current_site
-from django.db import IntegrityError
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
 from django.db.models import Count, Max
 from django.db.models.functions import Coalesce
 
@@ -18,8 +23,13 @@ from django.http import (
     Http404,
     JsonResponse,
     QueryDict,
+    StreamingHttpResponse,
 )
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
+from django.views.decorators.http import condition
 from pathlib import Path
 from planning.models import (
     PlanningArea,
@@ -29,43 +39,74 @@ from planning.models import (
     SharedLink,
 )
 from planning.serializers import (
+    ConfigurationSerializer,
     PlanningAreaSerializer,
     ScenarioSerializer,
     SharedLinkSerializer,
 )
 from planning.services import (
     export_to_shapefile,
+    stream_zip_directory,
     validate_scenario_treatment_ratio,
-    zip_directory,
 )
 from planning.tasks import async_forsys_run
+from rest_framework.fields import DateTimeField
 from urllib.parse import urljoin
 from utils.cli_utils import call_forsys
 
 
-# Retrieve the logged in user from the HTTP request.
-def _get_user(request: HttpRequest) -> User:
-    user = None
-    if hasattr(request, "user") and request.user.is_authenticated:
-        user = request.user
-    return user
+# Retrieve the logged in user from the HTTP request.  AuthenticationMiddleware
+# always sets request.user, so there is no need to probe for it first.
+def _get_user(request: HttpRequest) -> User | None:
+    return request.user if request.user.is_authenticated else None
 
 
 # We always need to store multipolygons, so coerce a single polygon to
-# a multigolygon if needed.
-def _convert_polygon_to_multipolygon(geometry: dict):
-    features = geometry.get("features", [])
-    if len(features) > 1 or len(features) == 0:
-        raise ValueError("Must send exactly one feature.")
-    feature = features[0]
-    geom = feature["geometry"]
+# a multigolygon if needed.  Accepts either a bare GeoJSON geometry or a
+# feature collection wrapping exactly one feature.
+def _get_multipolygon_coordinates(geometry: dict) -> list:
+    if "coordinates" in geometry:
+        geom = geometry
+    else:
+        features = geometry.get("features", [])
+        if len(features) > 1 or len(features) == 0:
+            raise ValueError("Must send exactly one feature.")
+        geom = features[0]["geometry"]
     if geom["type"] == "Polygon":
-        geom["type"] = "MultiPolygon"
-        geom["coordinates"] = [feature["geometry"]["coordinates"]]
-    actual_geometry = GEOSGeometry(json.dumps(geom))
-    if actual_geometry.geom_type != "MultiPolygon":
+        polygons = [geom["coordinates"]]
+    elif geom["type"] == "MultiPolygon":
+        polygons = geom["coordinates"]
+    else:
+        raise ValueError("Could not parse geometry")
+    if not _is_multipolygon_coordinates(polygons):
         raise ValueError("Could not parse geometry")
-    return actual_geometry
+    return polygons
+
+
+# Whether the given coordinates have the shape of GeoJSON MultiPolygon coordinates:
+# polygons of rings of positions, each position holding at least two numbers.
+def _is_multipolygon_coordinates(polygons) -> bool:
+    return isinstance(polygons, list) and all(
+        isinstance(rings, list)
+        and all(
+            isinstance(ring, list)
+            and all(
+                isinstance(position, list)
+                and len(position) >= 2
+                and all(isinstance(c, (int, float)) for c in position)
+                for position in ring
+            )
+            for ring in rings
+        )
+        for rings in polygons
+    )
+
+
+def _convert_polygon_to_multipolygon(geometry: dict):
+    polygons = _get_multipolygon_coordinates(geometry)
+    # Build the geometry straight from the already-parsed coordinates, rather than
+    # dumping them back to JSON for GEOS to parse again.  GeoJSON is always WGS84.
+    return MultiPolygon([Polygon(*rings) for rings in polygons], srid=4326)
 
 
 # TODO: Along with PlanningAreaSerializer, refactor this a bit more to
@@ -89,6 +130,108 @@ def _serialize_planning_area(planning_area: PlanningArea, add_geometry: bool) ->
     return result
 
 
+# Time to cache rendered planning area lists, in seconds.
+PLANNING_AREA_LIST_CACHE_SECONDS = 60 * 60
+
+# Number of planning area rows fetched at a time when rendering a list.
+PLANNING_AREA_LIST_CHUNK_SIZE = 50
+
+# Formats datetimes the same way PlanningAreaSerializer does.
+_DATETIME_FIELD = DateTimeField()
+
+
+def _planning_area_values_to_json(values: dict) -> str:
+    """
+    Renders a planning area row fetched with .values() as the same JSON object
+    _serialize_planning_area produces, without a DRF serializer or GEOS geometry per
+    row.  The geometry, if fetched, arrives already rendered as GeoJSON text by the
+    database, and is spliced in as-is rather than parsed into floats only to be
+    printed again.
+    """
+    properties = {
+        "user": values["user"],
+        "name": values["name"],
+        "notes": values["notes"],
+        "region_name": region_to_display_name(values["region_name"]),
+        "scenario_count": values["scenario_count"],
+        "latest_updated": _DATETIME_FIELD.to_representation(
+            values["scenario_latest_updated_at"]
+        ),
+        "created_at": _DATETIME_FIELD.to_representation(values["created_at"]),
+        "id": values["id"],
+    }
+    if "geometry_geojson" not in values:
+        return json.dumps(properties)
+    geometry = values["geometry_geojson"] or "null"
+    return json.dumps(properties)[:-1] + ', "geometry": ' + geometry + "}"
+
+
+# ETags let clients that already hold a fresh copy of a response get an empty 304
+# back instead, without the view querying and serializing anything.  Each is a hash
+# of the updated_at timestamps (and row counts, which catch deletions) that the
+# response body depends on.  Returning None skips conditional processing, so the
+# view reports any error itself.
+def _make_etag(*parts) -> str:
+    return hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+
+
+def _planning_area_etag(request: HttpRequest) -> str | None:
+    user = _get_user(request)
+    if user is None:
+        return None
+    try:
+        summary = user.planning_areas.filter(id=request.GET["id"]).aggregate(
+            Max("updated_at"), Max("scenarios__updated_at"), Count("scenarios")
+        )
+    except (KeyError, ValueError):
+        return None
+    if summary["updated_at__max"] is None:
+        return None
+    return _make_etag(user.pk, *summary.values())
+
+
+# Identifies the exact contents of a user's planning area list.  This is both the
+# list's ETag and the key for list_planning_areas' server-side cache.
+def _planning_area_list_summary(user: User) -> str:
+    summary = user.planning_areas.aggregate(
+        Max("updated_at"),
+        Max("scenarios__updated_at"),
+        Count("id", distinct=True),
+        Count("scenarios", distinct=True),
+    )
+    return _make_etag(user.pk, *summary.values())
+
+
+def _scenario_etag(request: HttpRequest) -> str | None:
+    user = _get_user(request)
+    if user is None:
+        return None
+    try:
+        updated_ats = (
+            Scenario.objects.filter(
+                id=request.GET["id"], planning_area__user_id=user.pk
+            )
+            .values_list("updated_at", "results__updated_at")
+            .first()
+        )
+    except (KeyError, ValueError):
+        return None
+    if updated_ats is None:
+        return None
+    return _make_etag(user.pk, *updated_ats)
+
+
+def _shared_link_etag(request: HttpRequest, link_code: str) -> str | None:
+    updated_at = (
+        SharedLink.objects.filter(link_code=link_code)
+        .values_list("updated_at", flat=True)
+        .first()
+    )
+    if updated_at is None:
+        return None
+    return _make_etag(link_code, updated_at)
+
+
 #### PLAN(NING AREA) Handlers ####
 def create_planning_area(request: HttpRequest) -> HttpResponse:
     """
@@ -101,8 +244,8 @@ def create_planning_area(request: HttpRequest) -> HttpResponse:
     Required params:
       name (str): User-provided name of the planning area.
       region_name (str): The region name, in user-facing form, e.g. "Sierra Nevada"
-      geometry (JSON str): The planning area shape, in GEOGeometry-compatible JSON.
-         This can be '{}', but the param does need to be specified.
+      geometry (JSON str): The planning area shape, in GEOGeometry-compatible JSON,
+         either a bare Polygon/MultiPolygon or a feature collection of one feature.
 
     Optional params:
       notes (str): An optional note string for this planning area.
@@ -133,6 +276,19 @@ def create_planning_area(request: HttpRequest) -> HttpResponse:
         if geometry is None:
             raise ValueError("Must specify the planning area geometry.")
 
+        # Reject oversized geometries before building them, since GEOS time and memory
+        # grow with the number of vertices.
+        vertex_count = sum(
+            len(ring)
+            for rings in _get_multipolygon_coordinates(geometry)
+            for ring in rings
+        )
+        if vertex_count > settings.MAX_GEOMETRY_VERTICES:
+            return HttpResponse(
+                "Planning area geometry has too many vertices.",
+                status=413,
+            )
+
         # Convert to a MultiPolygon if it is a simple Polygon, since the model column type is
         # MultiPolygon.
         geometry = _convert_polygon_to_multipolygon(geometry)
@@ -145,7 +301,6 @@ def create_planning_area(request: HttpRequest) -> HttpResponse:
             geometry=geometry,
             notes=body.get("notes", None),
         )
-        planning_area.save()
 
         return HttpResponse(
             json.dumps({"id": planning_area.pk}), content_type="application/json"
@@ -187,8 +342,11 @@ def delete_planning_area(request: HttpRequest) -> HttpResponse:
         else:
             raise ValueError("Planning Area ID must be an int or a list of ints.")
 
-        # Get the planning area(s) for just the logged in user.
-        planning_areas = user.planning_areas.filter(pk__in=planning_area_ids)
+        # Get the planning area(s) for just the logged in user.  Deleting only needs
+        # their IDs, so don't fetch anything else (in particular, the geometry).
+        # Cascaded scenarios and results are likewise collected by ID alone, and all
+        # the deletes run in one transaction.
+        planning_areas = user.planning_areas.filter(pk__in=planning_area_ids).only("pk")
 
         planning_areas.delete()
 
@@ -224,13 +382,18 @@ def update_planning_area(request: HttpRequest) -> HttpResponse:
 
         body = json.loads(request.body)
         planning_area_id = body.get("id", None)
-        planning_area = get_object_or_404(user.planning_areas, id=planning_area_id)
-        is_dirty = False
+        # Only the name and notes can change, so don't fetch (or write back) the
+        # geometry.
+        planning_area = get_object_or_404(
+            user.planning_areas.defer("geometry"), id=planning_area_id
+        )
+        # Write back only the fields that changed (and the timestamp).
+        updated_fields = []
 
         if "notes" in body:
             # This can clear the notes field
             planning_area.notes = body.get("notes")
-            is_dirty = True
+            updated_fields.append("notes")
 
         if "name" in body:
             # This must be always defined
@@ -238,10 +401,10 @@ def update_planning_area(request: HttpRequest) -> HttpResponse:
             if (new_name is None) or (len(new_name) == 0):
                 raise ValueError("name must be defined")
             planning_area.name = new_name
-            is_dirty = True
+            updated_fields.append("name")
 
-        if is_dirty:
-            planning_area.save()
+        if updated_fields:
+            planning_area.save(update_fields=updated_fields + ["updated_at"])
 
         return HttpResponse(
             json.dumps({"id": planning_area_id}), content_type="application/json"
@@ -250,6 +413,7 @@ def update_planning_area(request: HttpRequest) -> HttpResponse:
         return HttpResponseBadRequest("Ill-formed request: " + str(e))
 
 
+@condition(etag_func=_planning_area_etag)
 def get_planning_area_by_id(request: HttpRequest) -> HttpResponse:
     """
     Retrieves a planning area by ID.
@@ -284,6 +448,48 @@ def get_planning_area_by_id(request: HttpRequest) -> HttpResponse:
         return HttpResponseBadRequest("Ill-formed request: " + str(e))
 
 
+def _render_planning_area_list(user_id: int, add_geometry: bool) -> str:
+    # TODO: This could be really slow; consider paging.
+    # given that we need geometry to calculate total acres, should we save this value
+    # when creating the planning area instead of calculating it each time?
+    planning_areas = (
+        PlanningArea.objects.filter(user=user_id)
+        .annotate(scenario_count=Count("scenarios", distinct=True))
+        .annotate(
+            scenario_latest_updated_at=Coalesce(
+                Max("scenarios__updated_at"), "updated_at"
+            )
+        )
+        .order_by("-scenario_latest_updated_at")
+    )
+    fields = [
+        "id",
+        "user",
+        "name",
+        "notes",
+        "region_name",
+        "scenario_count",
+        "scenario_latest_updated_at",
+        "created_at",
+    ]
+    if add_geometry:
+        # AsGeoJSON rounds to 8 decimal places by default; keep the full precision
+        # get_planning_area_by_id renders.
+        planning_areas = planning_areas.annotate(
+            geometry_geojson=AsGeoJSON("geometry", precision=15)
+        )
+        fields.append("geometry_geojson")
+    # Rows are fetched in small batches, since each one can carry a large geometry;
+    # only the rendered JSON for each row is kept.
+    planning_areas_json = ", ".join(
+        _planning_area_values_to_json(planning_area)
+        for planning_area in planning_areas.values(*fields).iterator(
+            chunk_size=PLANNING_AREA_LIST_CHUNK_SIZE
+        )
+    )
+    return "[" + planning_areas_json + "]"
+
+
 # No Params expected, since we're always using the logged in user.
 def list_planning_areas(request: HttpRequest) -> HttpResponse:
     """
@@ -297,35 +503,34 @@ def list_planning_areas(request: HttpRequest) -> HttpResponse:
         PlanningArea updated_at if no scenarios
 
     Required params: none
+
+    Optional params:
+      add_geometry (str): "false" to leave out each planning area's geometry, which
+        is by far the largest part of the response.  Defaults to "true".
     """
     try:
         user = _get_user(request)
         if user is None:
             raise ValueError("User must be logged in.")
         user_id = user.pk
-
-        # TODO: This could be really slow; consider paging or perhaps
-        # fetching everything but geometries (since they're huge) for performance gains.
-        # given that we need geometry to calculate total acres, should we save this value
-        # when creating the planning area instead of calculating it each time?
-
-        planning_areas = (
-            PlanningArea.objects.filter(user=user_id)
-            .annotate(scenario_count=Count("scenarios", distinct=True))
-            .annotate(
-                scenario_latest_updated_at=Coalesce(
-                    Max("scenarios__updated_at"), "updated_at"
-                )
-            )
-            .order_by("-scenario_latest_updated_at")
-        )
-        return JsonResponse(
-            [
-                _serialize_planning_area(planning_area, True)
-                for planning_area in planning_areas
-            ],
-            safe=False,
-        )
+        add_geometry = request.GET.get("add_geometry", "true").lower() != "false"
+
+        # The list's summary identifies its exact contents, so it serves both as the
+        # ETag and as the key for the rendered list, which is then shared by all of
+        # the user's clients.  It is checked here rather than with @condition, so
+        # that the summary query runs only once.
+        summary = _planning_area_list_summary(user)
+        etag = quote_etag(summary)
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            cache_key = f"planning_area_list:{summary}:{add_geometry}"
+            content = cache.get(cache_key)
+            if content is None:
+                content = _render_planning_area_list(user_id, add_geometry)
+                cache.set(cache_key, content, PLANNING_AREA_LIST_CACHE_SECONDS)
+            response = HttpResponse(content, content_type="application/json")
+        response.headers["ETag"] = etag
+        return response
     except Exception as e:
         return HttpResponseBadRequest("Ill-formed request: " + str(e))
 
@@ -340,6 +545,52 @@ def _serialize_scenario(scenario: Scenario) -> dict:
     return data
 
 
+# Formats nested scenario configurations the same way ScenarioSerializer does.
+_CONFIGURATION_SERIALIZER = ConfigurationSerializer()
+
+
+def _format_datetime(value: datetime | None) -> str | None:
+    return None if value is None else _DATETIME_FIELD.to_representation(value)
+
+
+def _scenario_values_to_dict(values: dict) -> dict:
+    """
+    Serializes a scenario row fetched with .values() (along with its result's
+    fields, prefixed "results__") into the same dictionary _serialize_scenario
+    produces, without instantiating a model or a ScenarioSerializer per row.
+    """
+    configuration = values["configuration"]
+    scenario = {
+        "id": values["id"],
+        "updated_at": _format_datetime(values["updated_at"]),
+        "created_at": _format_datetime(values["created_at"]),
+        "planning_area": values["planning_area"],
+        "name": values["name"],
+        "notes": values["notes"],
+        "configuration": (
+            None
+            if configuration is None
+            else _CONFIGURATION_SERIALIZER.to_representation(configuration)
+        ),
+    }
+    # Like the serializer, report a missing result as null.
+    if values["results__id"] is None:
+        scenario["scenario_result"] = None
+    else:
+        scenario["scenario_result"] = {
+            "id": values["results__id"],
+            "created_at": _format_datetime(values["results__created_at"]),
+            "updated_at": _format_datetime(values["results__updated_at"]),
+            "started_at": _format_datetime(values["results__started_at"]),
+            "completed_at": _format_datetime(values["results__completed_at"]),
+            "status": values["results__status"],
+            "result": values["results__result"],
+            "run_details": values["results__run_details"],
+        }
+    return scenario
+
+
+@condition(etag_func=_scenario_etag)
 def get_scenario_by_id(request: HttpRequest) -> HttpResponse:
     """
     Retrieves a scenario by its ID.
@@ -355,10 +606,14 @@ def get_scenario_by_id(request: HttpRequest) -> HttpResponse:
         if user is None:
             raise ValueError("User must be logged in.")
 
-        scenario = Scenario.objects.select_related("planning_area__user").get(
-            id=request.GET["id"]
+        # Only the owner's ID is needed from the planning area, so skip its geometry;
+        # the scenario result is serialized along with the scenario.
+        scenario = (
+            Scenario.objects.select_related("planning_area", "results")
+            .defer("planning_area__geometry")
+            .get(id=request.GET["id"])
         )
-        if scenario.planning_area.user.pk != user.pk:
+        if scenario.planning_area.user_id != user.pk:
             # This matches the same error string if the planning area doesn't exist in the DB for any user.
             raise ValueError("Scenario matching query does not exist.")
         return JsonResponse(_serialize_scenario(scenario), safe=False)
@@ -387,8 +642,10 @@ def download_csv(request: HttpRequest) -> HttpResponse:
             status=401,
         )
 
+    # Only the owner's ID is needed from the planning area, so skip its geometry.
     scenario = (
-        Scenario.objects.select_related("planning_area__user")
+        Scenario.objects.select_related("planning_area")
+        .defer("planning_area__geometry")
         .filter(id=request.GET["id"])
         .first()
     )
@@ -400,25 +657,23 @@ def download_csv(request: HttpRequest) -> HttpResponse:
         )
 
     # Ensure that current user is associated with this scenario
-    if scenario.planning_area.user.pk != user.pk:
+    if scenario.planning_area.user_id != user.pk:
         return HttpResponse(
             "Scenario matching query does not exist.",
             status=404,
         )
 
-    scenario_result = ScenarioResult.objects.get(scenario__id=scenario.pk)
-
     try:
         output_zip_name: str = str(scenario.uuid) + ".zip"
 
         if not scenario.get_forsys_folder().exists():
             raise ValueError("Scenario files cannot be read.")
 
-        response = HttpResponse(content_type="application/zip")
-        #  here we're just writing directly to the response obj.
-        # Do we want to write this locally -- either to (effectively) cache it, or to reduce server memory load?
-        # Note that we don't close this, because `response` gets destroyed on its own
-        zip_directory(response, scenario.get_forsys_folder())
+        # The archive is compressed as it is sent, rather than built in memory first.
+        response = StreamingHttpResponse(
+            stream_zip_directory(scenario.get_forsys_folder()),
+            content_type="application/zip",
+        )
 
         response["Content-Disposition"] = f"attachment; filename={output_zip_name}"
         return response
@@ -446,18 +701,21 @@ def download_shapefile(request: HttpRequest) -> HttpResponse:
             status=401,
         )
 
-    scenario = Scenario.objects.select_related("planning_area__user").get(
-        id=request.GET["id"]
+    # Only the owner's ID is needed from the planning area, so skip its geometry;
+    # the scenario result is checked here and exported below.
+    scenario = (
+        Scenario.objects.select_related("planning_area", "results")
+        .defer("planning_area__geometry")
+        .get(id=request.GET["id"])
     )
     # Ensure that current user is associated with this scenario
-    if scenario.planning_area.user.pk != user.pk:
+    if scenario.planning_area.user_id != user.pk:
         return HttpResponse(
             "Scenario does not exist.",
             status=404,
         )
 
-    scenario_result = ScenarioResult.objects.get(scenario__id=scenario.pk)
-    if scenario_result.status != ScenarioResultStatus.SUCCESS:
+    if scenario.results.status != ScenarioResultStatus.SUCCESS:
         return HttpResponse(
             "Scenario was not successful, can't download data.",
             status=424,
@@ -466,8 +724,10 @@ def download_shapefile(request: HttpRequest) -> HttpResponse:
     try:
         output_zip_name = f"{str(scenario.uuid)}.zip"
         export_to_shapefile(scenario)
-        response = HttpResponse(content_type="application/zip")
-        zip_directory(response, scenario.get_shapefile_folder())
+        response = StreamingHttpResponse(
+            stream_zip_directory(scenario.get_shapefile_folder()),
+            content_type="application/zip",
+        )
 
         response["Content-Disposition"] = f"attachment; filename={output_zip_name}"
         return response
@@ -520,16 +780,18 @@ def create_scenario(request: HttpRequest) -> HttpResponse:
                 status=400,
             )
 
-        scenario = serializer.save()
-
-        # Create a default scenario result.
-        # Note that if this fails, we will have still written the Scenario without
-        # a corresponding ScenarioResult.
-        scenario_result = ScenarioResult.objects.create(scenario=scenario)
-        scenario_result.save()
-
-        if settings.USE_CELERY_FOR_FORSYS:
-            async_forsys_run.delay(scenario.pk)
+        # Create the scenario and its default scenario result together, so that
+        # a failure (e.g. a duplicate name) leaves neither behind.
+        with transaction.atomic():
+            scenario = serializer.save()
+            ScenarioResult.objects.create(scenario=scenario)
+
+            # Only queue the run once the scenario is committed; otherwise the
+            # worker can pick up the task before the scenario is visible to it.
+            if settings.USE_CELERY_FOR_FORSYS:
+                transaction.on_commit(
+                    lambda scenario_id=scenario.pk: async_forsys_run.delay(scenario_id)
+                )
 
         return JsonResponse({"id": scenario.pk})
 
@@ -571,19 +833,23 @@ def update_scenario(request: HttpRequest) -> HttpResponse:
         if scenario_id is None:
             raise ValueError("Scenario ID is required.")
 
-        scenario = Scenario.objects.select_related("planning_area__user").get(
-            id=scenario_id
+        # Only the owner's ID is needed from the planning area, so skip its geometry.
+        scenario = (
+            Scenario.objects.select_related("planning_area")
+            .defer("planning_area__geometry")
+            .get(id=scenario_id)
         )
-        if scenario.planning_area.user.pk != user.pk:
+        if scenario.planning_area.user_id != user.pk:
             # This matches the same error string if the planning area doesn't exist in the DB for any user.
             raise ValueError("Scenario matching query does not exist.")
 
-        is_dirty = False
+        # Write back only the fields that changed (and the timestamp).
+        updated_fields = []
 
         if "notes" in body:
             # This can clear the notes field
             scenario.notes = body.get("notes")
-            is_dirty = True
+            updated_fields.append("notes")
 
         if "name" in body:
             # This must be always defined
@@ -591,10 +857,10 @@ def update_scenario(request: HttpRequest) -> HttpResponse:
             if (new_name is None) or (len(new_name) == 0):
                 raise ValueError("name must be defined")
             scenario.name = new_name
-            is_dirty = True
+            updated_fields.append("name")
 
-        if is_dirty:
-            scenario.save()
+        if updated_fields:
+            scenario.save(update_fields=updated_fields + ["updated_at"])
 
         return HttpResponse(
             json.dumps({"id": scenario_id}), content_type="application/json"
@@ -608,6 +874,15 @@ def update_scenario(request: HttpRequest) -> HttpResponse:
 # by the EP.
 #
 # TODO: require credential from EP so that random people cannot call this endpoint.
+# The statuses a ScenarioResult may move to, each with the statuses it may move
+# from.  None means any status.
+_SCENARIO_RESULT_STATUS_TRANSITIONS = {
+    ScenarioResultStatus.RUNNING: {ScenarioResultStatus.PENDING},
+    ScenarioResultStatus.SUCCESS: {ScenarioResultStatus.RUNNING},
+    ScenarioResultStatus.FAILURE: None,
+}
+
+
 def update_scenario_result(request: HttpRequest) -> HttpResponse:
     """
     Updates a ScenarioResult's status.
@@ -632,31 +907,34 @@ def update_scenario_result(request: HttpRequest) -> HttpResponse:
         body = json.loads(request.body)
         scenario_id = body.get("scenario_id")
 
-        scenario_result = ScenarioResult.objects.get(scenario__id=scenario_id)
+        scenario_results = ScenarioResult.objects.filter(scenario__id=scenario_id)
+        # Write only the fields that were given (and the timestamp), in a single
+        # UPDATE.  update() skips auto_now, so the timestamp is set here.
+        updates = {"updated_at": timezone.now()}
 
         new_status = body.get("status")
-        old_status = scenario_result.status
-
         if new_status is not None:
-            match new_status:
-                case ScenarioResultStatus.RUNNING:
-                    if old_status != ScenarioResultStatus.PENDING:
-                        raise ValueError("Invalid new state.")
-                case ScenarioResultStatus.SUCCESS:
-                    if old_status != ScenarioResultStatus.RUNNING:
-                        raise ValueError("Invalid new state.")
-                case _:
-                    if new_status != ScenarioResultStatus.FAILURE:
-                        raise ValueError("Invalid new state.")
-            scenario_result.status = new_status
+            if new_status not in _SCENARIO_RESULT_STATUS_TRANSITIONS:
+                raise ValueError("Invalid new state.")
+            # Checking the old status in the same statement keeps two callbacks
+            # arriving together from both passing the check.
+            old_statuses = _SCENARIO_RESULT_STATUS_TRANSITIONS[new_status]
+            if old_statuses is not None:
+                scenario_results = scenario_results.filter(status__in=old_statuses)
+            updates["status"] = new_status
 
         if (run_details := body.get("run_details")) is not None:
-            scenario_result.run_details = run_details
+            updates["run_details"] = run_details
 
         if (result := body.get("result")) is not None:
-            scenario_result.result = result
+            updates["result"] = result
 
-        scenario_result.save()
+        if scenario_results.update(**updates) == 0:
+            if not ScenarioResult.objects.filter(scenario__id=scenario_id).exists():
+                raise ScenarioResult.DoesNotExist(
+                    "ScenarioResult matching query does not exist."
+                )
+            raise ValueError("Invalid new state.")
 
         return HttpResponse(
             json.dumps({"id": scenario_id}), content_type="application/json"
@@ -687,11 +965,30 @@ def list_scenarios_for_planning_area(request: HttpRequest) -> HttpResponse:
         if planning_area_id is None:
             raise ValueError("Missing planning_area")
 
-        scenarios = Scenario.objects.filter(planning_area__user_id=user.pk).filter(
-            planning_area__pk=planning_area_id
+        # Each scenario is serialized with its result, so fetch them together.
+        scenarios = (
+            Scenario.objects.filter(planning_area__user_id=user.pk)
+            .filter(planning_area__pk=planning_area_id)
+            .values(
+                "id",
+                "updated_at",
+                "created_at",
+                "planning_area",
+                "name",
+                "notes",
+                "configuration",
+                "results__id",
+                "results__created_at",
+                "results__updated_at",
+                "results__started_at",
+                "results__completed_at",
+                "results__status",
+                "results__result",
+                "results__run_details",
+            )
         )
         return JsonResponse(
-            [_serialize_scenario(scenario) for scenario in scenarios], safe=False
+            [_scenario_values_to_dict(scenario) for scenario in scenarios], safe=False
         )
     except Exception as e:
         return HttpResponseBadRequest("List Scenario error: " + str(e))
@@ -723,14 +1020,17 @@ def delete_scenario(request: HttpRequest) -> HttpResponse:
         scenario_ids = []
         if isinstance(scenario_id_str, int):
             scenario_ids = [scenario_id_str]
-        elif isinstance(scenario_ids, list):
+        elif isinstance(scenario_id_str, list):
             scenario_ids = scenario_id_str
         else:
             raise ValueError("scenario_id must be an int or a list of ints.")
 
-        # Get the scenarios matching the provided IDs and the logged-in user.
-        scenarios = Scenario.objects.filter(pk__in=scenario_ids).filter(
-            planning_area__user=user.pk
+        # Get the scenarios matching the provided IDs and the logged-in user.  Deleting
+        # only needs their IDs, so don't fetch configurations.
+        scenarios = (
+            Scenario.objects.filter(pk__in=scenario_ids)
+            .filter(planning_area__user=user.pk)
+            .only("pk")
         )
         # This automatically deletes ScenarioResult entries for the deleted Scenarios.
         scenarios.delete()
@@ -745,19 +1045,28 @@ def delete_scenario(request: HttpRequest) -> HttpResponse:
         return HttpResponseBadRequest("Delete Scenario error: " + str(e))
 
 
+@lru_cache(maxsize=1)
+def get_treatment_goals_by_region_name() -> dict:
+    """
+    Reads the treatment goals config once and indexes each region's treatment
+    goals by region name. Call get_treatment_goals_by_region_name.cache_clear()
+    to force a re-read.
+    """
+    config_path = os.path.join(settings.BASE_DIR, "config/treatment_goals.json")
+    with open(config_path, "r") as f:
+        treatment_goals_config = json.load(f)
+    return {
+        region["region_name"]: region["treatment_goals"]
+        for region in treatment_goals_config["regions"]
+    }
+
+
 def get_treatment_goals_config_for_region(params: QueryDict):
     # Get region name
     assert isinstance(params["region_name"], str)
     region_name = params["region_name"]
 
-    # Read from treatment_goals config
-    config_path = os.path.join(settings.BASE_DIR, "config/treatment_goals.json")
-    treatment_goals_config = json.load(open(config_path, "r"))
-    for region in treatment_goals_config["regions"]:
-        if region_name == region["region_name"]:
-            return region["treatment_goals"]
-
-    return None
+    return get_treatment_goals_by_region_name().get(region_name)
 
 
 def treatment_goals_config(request: HttpRequest) -> HttpResponse:
@@ -766,6 +1075,7 @@ def treatment_goals_config(request: HttpRequest) -> HttpResponse:
 
 
 #### SHARED LINK Handlers ####
+@condition(etag_func=_shared_link_etag)
 def get_shared_link(request: HttpRequest, link_code: str) -> HttpResponse:
     try:
         link_obj = SharedLink.objects.get(link_code=link_code)
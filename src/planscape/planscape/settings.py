@@ -9,6 +9,7 @@ These settings are
   PLANSCAPE_DATABASE_NAME: PostGIS database name
   PLANSCAPE_DATABASE_USER: PostGIS user name
   PLANSCAPE_DATABASE_PASSWORD: PostGIS database password
+  PLANSCAPE_DATABASE_CONN_MAX_AGE: Seconds to keep a database connection open
 
   PLANSCAPE_ALLOWED_HOSTS:        Comma-separated string of addresses
   PLANSCAPE_CORS_ALLOWED_ORIGINS: Comma-separated string of addresses
@@ -123,6 +124,10 @@ PLANSCAPE_DATABASE_PASSWORD = config("PLANSCAPE_DATABASE_PASSWORD", default="pas
 PLANSCAPE_DATABASE_USER = config("PLANSCAPE_DATABASE_USER", default="planscape")
 PLANSCAPE_DATABASE_NAME = config("PLANSCAPE_DATABASE_NAME", default="planscape")
 PLANSCAPE_DATABASE_PORT = config("PLANSCAPE_PORT", default=5432)
+# Reuse database connections across requests instead of reconnecting each time.
+PLANSCAPE_DATABASE_CONN_MAX_AGE = config(
+    "PLANSCAPE_DATABASE_CONN_MAX_AGE", default=600, cast=int
+)
 DATABASES = {
     "default": {
         "ENGINE": "django.contrib.gis.db.backends.postgis",
@@ -131,6 +136,8 @@ DATABASES = {
         "USER": PLANSCAPE_DATABASE_USER,
         "PASSWORD": PLANSCAPE_DATABASE_PASSWORD,
         "PORT": PLANSCAPE_DATABASE_PORT,
+        "CONN_MAX_AGE": PLANSCAPE_DATABASE_CONN_MAX_AGE,
+        "CONN_HEALTH_CHECKS": True,
         "TEST": {
             "NAME": "auto_test",
         },
@@ -365,6 +372,12 @@ OUTPUT_DIR = BASE_DIR / "output"
 
 DEFAULT_EST_COST_PER_ACRE = config("DEFAULT_EST_COST_PER_ACRE", 2470, cast=float)
 
+# Largest planning area geometry accepted, in vertices.  Request bodies are also
+# capped in bytes by DATA_UPLOAD_MAX_MEMORY_SIZE (2.5 MB by default), which holds
+# roughly 60k vertices at the ~40 bytes each of real coordinates, so keep this
+# below that for the limit to take effect.
+MAX_GEOMETRY_VERTICES = config("MAX_GEOMETRY_VERTICES", 50000, cast=int)
+
 
 # SINGLE QUEUE BEHAVIOR
 USE_CELERY_FOR_FORSYS = config("USE_CELERY_FOR_FORSYS", False, cast=bool)
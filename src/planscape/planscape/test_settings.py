@@ -0,0 +1,9 @@
+"""
+Django settings for running the test suite, e.g.
+`python manage.py test --settings planscape.test_settings`.
+"""
+
+from planscape.settings import *  # noqa: F401,F403
+
+# The default PBKDF2 hasher is deliberately slow; tests don't need that.
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
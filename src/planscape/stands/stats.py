@@ -4,10 +4,7 @@ from rasterstats.io import parse_feature
 import numpy as np
 from shapely.geometry import shape
 from rasterstats.main import Raster
-from rasterstats.utils import (
-    key_assoc_val,
-    rasterize_geom,
-)
+from rasterstats.utils import rasterize_geom
 
 
 def get_zonal_stats(
@@ -64,18 +61,9 @@ def get_zonal_stats(
                 "minority": None,
             }
 
+        # keys are sorted, and argmax/argmin return the first occurrence, so
+        # ties resolve to the smallest pixel value.
         keys, counts = np.unique(masked.compressed(), return_counts=True)
-        try:
-            pixel_count = dict(
-                zip([k.item() for k in keys], [c.item() for c in counts])
-            )
-        except AttributeError:
-            pixel_count = dict(
-                zip(
-                    [np.asscalar(k) for k in keys],
-                    [np.asscalar(c) for c in counts],
-                )
-            )
 
         return {
             "min": float(masked.min()),
@@ -83,6 +71,6 @@ def get_zonal_stats(
             "mean": float(masked.mean(dtype=accum_dtype)),
             "count": int(masked.count()),
             "sum": float(masked.sum(dtype=accum_dtype)),
-            "majority": float(key_assoc_val(pixel_count, max)),
-            "minority": float(key_assoc_val(pixel_count, min)),
+            "majority": float(keys[np.argmax(counts)]),
+            "minority": float(keys[np.argmin(counts)]),
         }
@@ -2,16 +2,29 @@ import re
 import time
 
 from allauth.account.models import EmailAddress
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
 from django.core import mail
 from django.test import TransactionTestCase, override_settings
 from django.urls import reverse
 
+# URLs of the endpoints under test, resolved once.
+_URL_REST_LOGIN = reverse("rest_login")
+_URL_REST_PASSWORD_CHANGE = reverse("rest_password_change")
+_URL_REST_PASSWORD_RESET = reverse("rest_password_reset")
+_URL_REST_PASSWORD_RESET_CONFIRM = reverse("rest_password_reset_confirm")
+_URL_REST_REGISTER = reverse("rest_register")
+_URL_DELETE = reverse("users:delete")
+_URL_IS_VERIFIED_USER = reverse("users:is_verified_user")
+
+# Hash the fixture password once, instead of once per test.
+_PASSWORD_HASH = make_password("12345")
+
 
 class CreateUserTest(TransactionTestCase):
     def test_create_user_username_is_email(self):
         response = self.client.post(
-            reverse("rest_register"),
+            _URL_REST_REGISTER,
             {
                 "email": "testuser@test.com",
                 "password1": "ComplexPassword123",
@@ -35,13 +48,13 @@ class CreateUserTest(TransactionTestCase):
 
 class DeleteUserTest(TransactionTestCase):
     def setUp(self):
-        self.user = User.objects.create(email="testuser@test.com")
-        self.user.set_password("12345")
-        self.user.save()
+        self.user = User.objects.create(
+            email="testuser@test.com", password=_PASSWORD_HASH
+        )
 
     def test_missing_user(self):
         response = self.client.post(
-            reverse("users:delete"),
+            _URL_DELETE,
             {"email": "testuser@test.com"},
             content_type="application/json",
         )
@@ -49,15 +62,13 @@ class DeleteUserTest(TransactionTestCase):
 
     def test_missing_email(self):
         self.client.force_login(self.user)
-        response = self.client.post(
-            reverse("users:delete"), {}, content_type="application/json"
-        )
+        response = self.client.post(_URL_DELETE, {}, content_type="application/json")
         self.assertEqual(response.status_code, 400)
 
     def test_missing_password(self):
         self.client.force_login(self.user)
         response = self.client.post(
-            reverse("users:delete"),
+            _URL_DELETE,
             {"email": "testuser@test.com"},
             content_type="application/json",
         )
@@ -66,7 +77,7 @@ class DeleteUserTest(TransactionTestCase):
     def test_different_user(self):
         self.client.force_login(self.user)
         response = self.client.post(
-            reverse("users:delete"),
+            _URL_DELETE,
             {"email": "diffuser@test.com"},
             content_type="application/json",
         )
@@ -75,7 +86,7 @@ class DeleteUserTest(TransactionTestCase):
     def test_same_user(self):
         self.client.force_login(self.user)
         response = self.client.post(
-            reverse("users:delete"),
+            _URL_DELETE,
             {"email": "testuser@test.com", "password": "12345"},
             content_type="application/json",
         )
@@ -86,7 +97,7 @@ class DeleteUserTest(TransactionTestCase):
 class IsVerifiedUserTest(TransactionTestCase):
     def setUp(self):
         self.client.post(
-            reverse("rest_register"),
+            _URL_REST_REGISTER,
             {
                 "email": "testuser@test.com",
                 "password1": "ComplexPassword123",
@@ -98,12 +109,12 @@ class IsVerifiedUserTest(TransactionTestCase):
         self.user = User.objects.filter(email="testuser@test.com").get()
 
     def test_not_logged_in(self):
-        response = self.client.get(reverse("users:is_verified_user"))
+        response = self.client.get(_URL_IS_VERIFIED_USER)
         self.assertEqual(response.status_code, 400)
 
     def test_not_verified(self):
         self.client.force_login(self.user)
-        response = self.client.get(reverse("users:is_verified_user"))
+        response = self.client.get(_URL_IS_VERIFIED_USER)
         self.assertEqual(response.status_code, 400)
 
     def test_verfied(self):
@@ -112,14 +123,14 @@ class IsVerifiedUserTest(TransactionTestCase):
         email.verified = True
         email.save()
 
-        response = self.client.get(reverse("users:is_verified_user"))
+        response = self.client.get(_URL_IS_VERIFIED_USER)
         self.assertEqual(response.status_code, 200)
 
 
 class PasswordResetTest(TransactionTestCase):
     def setUp(self):
         self.client.post(
-            reverse("rest_register"),
+            _URL_REST_REGISTER,
             {
                 "email": "testuser@test.com",
                 "password1": "ComplexPassword123",
@@ -132,7 +143,7 @@ class PasswordResetTest(TransactionTestCase):
 
     def test_reset_link(self):
         self.client.post(
-            reverse("rest_password_reset"),
+            _URL_REST_PASSWORD_RESET,
             {"email": "testuser@test.com"},
             HTTP_ORIGIN="http://localhost:4200",
         )
@@ -144,7 +155,7 @@ class PasswordResetTest(TransactionTestCase):
 
     def test_reset_confirmation_email(self):
         # POST request to get reset password link.
-        self.client.post(reverse("rest_password_reset"), {"email": "testuser@test.com"})
+        self.client.post(_URL_REST_PASSWORD_RESET, {"email": "testuser@test.com"})
 
         # Check that reset email was sent and extract reset token.
         self.assertEqual(len(mail.outbox), 1)
@@ -163,7 +174,7 @@ class PasswordResetTest(TransactionTestCase):
 
         # POST request to set new password with token.
         response = self.client.post(
-            reverse("rest_password_reset_confirm"),
+            _URL_REST_PASSWORD_RESET_CONFIRM,
             {
                 "new_password1": "ComplexPassword456",
                 "new_password2": "ComplexPassword456",
@@ -189,7 +200,7 @@ class PasswordResetTest(TransactionTestCase):
         self.assertEqual(response.status_code, 400)
 
         # POST request to get reset password link.
-        self.client.post(reverse("rest_password_reset"), {"email": "testuser@test.com"})
+        self.client.post(_URL_REST_PASSWORD_RESET, {"email": "testuser@test.com"})
 
         # Check that reset email was sent and extract reset token.
         self.assertEqual(len(mail.outbox), 1)
@@ -219,7 +230,7 @@ class PasswordResetTest(TransactionTestCase):
 class PasswordChangeTest(TransactionTestCase):
     def setUp(self):
         self.client.post(
-            reverse("rest_register"),
+            _URL_REST_REGISTER,
             {
                 "email": "testuser@test.com",
                 "password1": "ComplexPassword123",
@@ -238,14 +249,14 @@ class PasswordChangeTest(TransactionTestCase):
         # Must do a full login.
         # `self.client.force_login(self.user)` does not work.
         response = self.client.post(
-            reverse("rest_login"),
+            _URL_REST_LOGIN,
             {"email": "testuser@test.com", "password": "ComplexPassword123"},
         )
         self.assertEqual(response.status_code, 200)
 
         # POST request to change password.
         response = self.client.post(
-            reverse("rest_password_change"),
+            _URL_REST_PASSWORD_CHANGE,
             {
                 "old_password": "ComplexPassword123",
                 "new_password1": "ComplexPassword456",
@@ -266,7 +277,7 @@ class PasswordChangeTest(TransactionTestCase):
 class LoginTest(TransactionTestCase):
     def setUp(self):
         self.client.post(
-            reverse("rest_register"),
+            _URL_REST_REGISTER,
             {
                 "email": "testuser@test.com",
                 "password1": "ComplexPassword123",
@@ -281,7 +292,7 @@ class LoginTest(TransactionTestCase):
 
     def test_login_unverified_user(self):
         response = self.client.post(
-            reverse("rest_login"),
+            _URL_REST_LOGIN,
             {"email": "testuser@test.com", "password": "ComplexPassword123"},
         )
         self.assertEqual(response.status_code, 400)
@@ -292,14 +303,14 @@ class LoginTest(TransactionTestCase):
         email.save()
 
         response = self.client.post(
-            reverse("rest_login"),
+            _URL_REST_LOGIN,
             {"email": "testuser@test.com", "password": "ComplexPassword123"},
         )
         self.assertEqual(response.status_code, 200)
 
     def test_login_incorrect_password(self):
         response = self.client.post(
-            reverse("rest_login"),
+            _URL_REST_LOGIN,
             {"email": "testuser@test.com", "password": "IncorrectPassword"},
         )
         self.assertEqual(response.status_code, 400)
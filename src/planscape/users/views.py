@@ -10,11 +10,10 @@ from dj_rest_auth.views import UserDetailsView
 from users.serializers import UserSerializer
 
 
-def get_user(request: HttpRequest) -> User:
-    user = None
-    if hasattr(request, "user") and request.user.is_authenticated:
-        user = request.user
-    return user
+# AuthenticationMiddleware always sets request.user, so there is no need to probe for
+# it first.
+def get_user(request: HttpRequest) -> User | None:
+    return request.user if request.user.is_authenticated else None
 
 
 def get_user_by_id(request: HttpRequest) -> HttpResponse: